@@ -0,0 +1,49 @@
+"""
+Measures the per-invocation import cost of `python -m solutions`.
+
+"eager" imports every day module up front, as `__main__` used to; "lazy" only
+imports the day being run, as the registry does now. Run from the repo root:
+
+    python benchmarks/startup.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS: dict[str, str] = {
+    "interpreter": "pass",
+    "eager": (
+        "import solutions.__main__ as m; "
+        "[m.solution_functions[d] for d in m.solution_functions]"
+    ),
+    "lazy": "import solutions.__main__ as m; m.solution_functions[1]",
+}
+
+
+def time_scenario(code: str, runs: int) -> list[float]:
+    timings: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(*args: str) -> None:
+    runs = int(args[1]) if len(args) > 1 else 20
+    medians: dict[str, float] = {}
+    for name, code in SCENARIOS.items():
+        time_scenario(code, 2)
+        medians[name] = statistics.median(time_scenario(code, runs)) * 1000
+    interpreter = medians["interpreter"]
+    for name, median in medians.items():
+        print(
+            f"{name:>12}: {median:7.1f} ms median "
+            f"({median - interpreter:+7.1f} ms over bare interpreter)"
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv)
@@ -0,0 +1,25 @@
+"""
+At the repo root, with `pytest.ini`, so that `--benchmarks` is registered
+however pytest is invoked: from the root, from `solutions/`, or on a path.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="also run the tests marked benchmark, which check time and memory",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
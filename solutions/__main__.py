@@ -1,83 +1,192 @@
+import importlib
 import sys
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator
-
-from solutions import (
-    day01,
-    day02,
-    day03,
-    day04,
-    day05,
-    day06,
-    day07,
-    day08,
-    day09,
-    day10,
-    day11,
-    day12,
-    day13,
-    day14,
-    day15,
-    day16,
-    day17,
-    day18,
-    day19,
-    day20,
-    day21,
-    day22,
-)
+from typing import Any, Iterator
+
+from solutions.budget import time_budget
 from solutions.parsing import ArgsModel, build_parser
+from solutions.registry import Solver, solution_functions
 
-solution_functions: dict[int, list[Callable[[list[str], bool], Any]]] = {
-    1: [day01.alpha],
-    2: [day02.alpha],
-    3: [day03.alpha],
-    4: [day04.alpha],
-    5: [day05.alpha],
-    6: [day06.alpha, day06.beta],
-    7: [day07.alpha],
-    8: [day08.alpha, day08.beta],
-    9: [day09.alpha, day09.beta],
-    10: [day10.alpha],
-    11: [day11.alpha],
-    12: [day12.alpha],
-    13: [day13.alpha],
-    14: [day14.alpha],
-    15: [day15.alpha],
-    16: [day16.alpha],
-    17: [day17.alpha],
-    18: [day18.alpha],
-    19: [day19.alpha],
-    20: [day20.alpha],
-    21: [day21.alpha],
-    22: [day22.alpha],
+SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "bench": ("solutions.bench", "main"),
+    "pool": ("solutions.pool", "main"),
+    "serve": ("solutions.daemon", "serve_main"),
+    "client": ("solutions.daemon", "client_main"),
+    "generate": ("solutions.generators", "main"),
+    "sweep": ("solutions.sweep", "main"),
+    "parity": ("solutions.parity", "main"),
 }
 
 
 def main() -> None:
+    argv = sys.argv[1:]
+    if argv and argv[0] in SUBCOMMANDS:
+        module_name, function_name = SUBCOMMANDS[argv[0]]
+        getattr(importlib.import_module(module_name), function_name)(argv[1:])
+        return
     parser = build_parser(MainArgs)
-    args = parser.parse(sys.argv[1:])
+    args = parser.parse(argv)
+    if args.profile:
+        from solutions import profiling
+
+        profiling.enable_hot_paths()
     day_solvers = solution_functions.get(args.day_number, [])
+    if args.compare_versions:
+        if not day_solvers:
+            raise UnsolvedError(args.day_number, 0)
+        if args.input_filepath is None:
+            parser.arg_parser.error("--compare-versions needs an input_filepath")
+        from solutions.compare import compare_versions, format_comparison
+        from solutions.inputs import read_input
+
+        timings = compare_versions(
+            day_solvers, read_input(args.input_filepath), repeats=args.repeats
+        )
+        print(timings[0].answer)
+        for line in format_comparison(timings):
+            print(line)
+        return
     if len(day_solvers) <= args.version:
         raise UnsolvedError(args.day_number, args.version)
     solver = day_solvers[args.version]
-    with open(args.input_filepath) as f:
-        input_strs = [line.replace("\n", "") for line in f.readlines()]
-    with timeit(args.timeit):
-        print(solver(input_strs, args.debug))
+    if args.input_dir is not None:
+        from solutions.batch import batch_inputs, print_batch
+
+        input_filepaths = batch_inputs(args.input_dir, args.glob)
+        if print_batch(solver, input_filepaths, args.budget):
+            sys.exit(1)
+        return
+    if args.input_filepath is None:
+        parser.arg_parser.error("either input_filepath or --input-dir is required")
+    if args.part is not None:
+        from solutions.inputs import read_input
+        from solutions.parts import parse_parts, solve_parts
+        from solutions.timing import format_ns
+
+        try:
+            parts = parse_parts(args.part)
+        except ValueError as e:
+            parser.arg_parser.error(str(e))
+        with time_budget(args.budget), traced(args), reported_metrics(args):
+            answers, timings = solve_parts(
+                solver, read_input(args.input_filepath), parts
+            )
+            print(answers[parts[0]] if len(parts) == 1 else tuple(answers.values()))
+        if args.timeit:
+            for stage, elapsed_ns in timings:
+                print(f"{stage}: {format_ns(elapsed_ns)}")
+        return
+    with (
+        timeit(args.timeit),
+        time_budget(args.budget),
+        traced(args),
+        reported_metrics(args),
+    ):
+        if not (
+            args.profile
+            or args.sample
+            or args.memory
+            or args.no_cache
+            or args.debug
+            or args.trace
+            or args.metrics
+            or args.timeit
+        ):
+            from solutions.cache import solve_cached
+
+            answer = solve_cached(
+                solver,
+                args.day_number,
+                args.version,
+                args.input_filepath,
+                refresh=args.refresh,
+            )
+        else:
+            from solutions.inputs import solver_input
+
+            with solver_input(solver, args.input_filepath) as inputs:
+                answer = solve_instrumented(solver, inputs, args)
+        print(answer)
+
+
+def solve_instrumented(solver: Solver, inputs: Any, args: "MainArgs") -> Any:
+    """Instrumentation modules are imported here, only when they're asked for."""
+    if args.profile:
+        from solutions import profiling
+
+        profile_filepath = (
+            args.profile_output or f"day{args.day_number:02}-v{args.version}.pstats"
+        )
+        with profiling.profile(profile_filepath, args.profile_top):
+            answer = solver(inputs, args.debug)
+        for line in profiling.hot_path_timers.report():
+            print(line)
+    elif args.sample:
+        from solutions import profiling
+
+        sample_filepath = (
+            args.sample_output or f"day{args.day_number:02}-v{args.version}.collapsed"
+        )
+        with profiling.sample_stacks(
+            sample_filepath, args.sample_interval / 1000
+        ) as samples:
+            answer = solver(inputs, args.debug)
+        for line in samples.report():
+            print(line)
+    elif args.memory:
+        from solutions import profiling
+
+        with profiling.trace_memory() as memory_report:
+            answer = solver(inputs, args.debug)
+        for line in memory_report.report():
+            print(line)
+    else:
+        answer = solver(inputs, args.debug)
+    return answer
 
 
 class MainArgs(ArgsModel):
     day_number: int
-    input_filepath: str
+    input_filepath: str | None = None
     version: int = 0
+    input_dir: str | None = None
+    glob: str = "*"
     debug: bool
     timeit: bool
+    no_cache: bool
+    refresh: bool
+    profile: bool
+    profile_output: str | None = None
+    profile_top: int = 20
+    sample: bool
+    sample_output: str | None = None
+    sample_interval: float = 5.0
+    memory: bool
+    compare_versions: bool
+    repeats: int = 5
+    budget: float | None = None
+    trace: str | None = None
+    trace_file: str = "trace.jsonl"
+    metrics: bool
+    part: str | None = None
 
     class Meta:
         flags: dict[str, tuple[str, str] | tuple[str] | str] = {
             "version": ("v", "version"),
+            "input_dir": "input-dir",
+            "glob": "glob",
+            "no_cache": "no-cache",
+            "profile_output": "profile-output",
+            "profile_top": "profile-top",
+            "sample_output": "sample-output",
+            "sample_interval": "sample-interval",
+            "compare_versions": "compare-versions",
+            "repeats": ("n", "repeats"),
+            "budget": "budget",
+            "trace": "trace",
+            "trace_file": "trace-file",
+            "part": ("p", "part"),
         }
 
 
@@ -87,6 +196,31 @@ class UnsolvedError(NotImplementedError):
         super().__init__(msg)
 
 
+@contextmanager
+def traced(args: MainArgs) -> Iterator[None]:
+    if args.trace is None:
+        yield
+        return
+    from solutions.tracing import trace_to
+
+    with trace_to(args.trace, args.trace_file):
+        yield
+
+
+@contextmanager
+def reported_metrics(args: MainArgs) -> Iterator[None]:
+    """Each search's metrics are printed as a JSON line after the answer."""
+    if not args.metrics:
+        yield
+        return
+    from solutions.metrics import collect_metrics
+
+    with collect_metrics() as collected:
+        yield
+    for metrics in collected:
+        print(metrics.to_json())
+
+
 @contextmanager
 def timeit(print_time: bool) -> Iterator[None]:
     start = time.time()
@@ -0,0 +1,94 @@
+import glob
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterator
+
+from solutions.budget import time_budget
+from solutions.inputs import solver_input
+from solutions.registry import Solver
+from solutions.timing import solve_captured
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    input_filepath: str
+    size_bytes: int
+    answer: str | None
+    output: str
+    error: str | None
+    elapsed_ns: int
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "file": self.input_filepath,
+                "bytes": self.size_bytes,
+                "answer": self.answer,
+                "output": self.output,
+                "error": self.error,
+                "elapsed_ms": self.elapsed_ns / 1_000_000,
+            }
+        )
+
+
+def batch_inputs(input_dir: str, pattern: str = "*") -> list[str]:
+    return sorted(
+        path
+        for path in glob.glob(os.path.join(input_dir, pattern), recursive=True)
+        if os.path.isfile(path)
+    )
+
+
+def run_batch(
+    solver: Solver, input_filepaths: list[str], budget: float | None = None
+) -> Iterator[BatchResult]:
+    """
+    Solves each input in turn with the one already-loaded solver. The time
+    budget applies to each input on its own.
+    """
+    for input_filepath in input_filepaths:
+        size_bytes = os.path.getsize(input_filepath)
+        with time_budget(budget), solve_captured() as solved:
+            with solver_input(solver, input_filepath) as inputs:
+                solved.time(lambda: solver(inputs, False))
+        yield BatchResult(
+            input_filepath,
+            size_bytes,
+            solved.answer,
+            solved.output,
+            solved.error,
+            solved.elapsed_ns,
+        )
+
+
+def print_batch(
+    solver: Solver, input_filepaths: list[str], budget: float | None = None
+) -> int:
+    """Prints a JSON line per input, then a summary line. Returns the failures."""
+    start = time.perf_counter_ns()
+    failures = 0
+    solve_ns = 0
+    total_bytes = 0
+    for result in run_batch(solver, input_filepaths, budget):
+        failures += result.error is not None
+        solve_ns += result.elapsed_ns
+        total_bytes += result.size_bytes
+        print(result.to_json(), flush=True)
+    wall_ns = time.perf_counter_ns() - start
+    wall_s = wall_ns / 1_000_000_000 or 1e-9
+    print(
+        json.dumps(
+            {
+                "files": len(input_filepaths),
+                "failures": failures,
+                "bytes": total_bytes,
+                "solve_ms": solve_ns / 1_000_000,
+                "wall_ms": wall_ns / 1_000_000,
+                "files_per_s": len(input_filepaths) / wall_s,
+                "mb_per_s": total_bytes / 1_000_000 / wall_s,
+            }
+        )
+    )
+    return failures
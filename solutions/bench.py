@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+from dataclasses import asdict
+
+from solutions.inputs import corpus_inputs, read_input
+from solutions.parsing import ArgsModel, build_parser
+from solutions.registry import solution_functions
+from solutions.timing import TimingStats, format_ns, measure, quiet
+
+
+def main(argv: list[str]) -> None:
+    parser = build_parser(BenchArgs)
+    args = parser.parse(argv)
+    results: dict[str, TimingStats] = {}
+    errors: dict[str, Exception] = {}
+    for day_number, input_filepaths in corpus_inputs(args.corpus).items():
+        if args.day_number is not None and day_number != args.day_number:
+            continue
+        for version, solver in enumerate(solution_functions.get(day_number, [])):
+            for input_filepath in input_filepaths:
+                key = bench_key(day_number, version, input_filepath)
+                input_strs = read_input(input_filepath)
+                try:
+                    with quiet():
+                        _, stats = measure(
+                            lambda: solver(input_strs, False),
+                            warmups=args.warmups,
+                            repeats=args.repeats,
+                        )
+                except Exception as e:
+                    errors[key] = e
+                    print(f"{key}: {e!r}")
+                    continue
+                results[key] = stats
+                print(
+                    f"{key}: min {format_ns(stats.min_ns)}, "
+                    f"median {format_ns(stats.median_ns)}, "
+                    f"p95 {format_ns(stats.p95_ns)}"
+                )
+
+    regressions: list[str] = []
+    if args.update or not os.path.exists(args.baseline):
+        write_baseline(args.baseline, results)
+        print(f"Wrote baseline of {len(results)} runs to {args.baseline}")
+    else:
+        baseline = read_baseline(args.baseline)
+        regressions = find_regressions(baseline, results, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+    if errors or regressions:
+        sys.exit(1)
+
+
+class BenchArgs(ArgsModel):
+    corpus: str = "inputs"
+    day_number: int | None = None
+    warmups: int = 1
+    repeats: int = 5
+    baseline: str = "bench_baseline.json"
+    threshold: float = 0.2
+    update: bool
+
+    class Meta:
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {
+            "corpus": "corpus",
+            "day_number": ("d", "day"),
+            "warmups": "warmups",
+            "repeats": ("n", "repeats"),
+            "baseline": "baseline",
+            "threshold": "threshold",
+        }
+
+
+def bench_key(day_number: int, version: int, input_filepath: str) -> str:
+    return f"day{day_number:02}:v{version}:{os.path.basename(input_filepath)}"
+
+
+def write_baseline(baseline_filepath: str, results: dict[str, TimingStats]) -> None:
+    with open(baseline_filepath, "w") as f:
+        json.dump({key: asdict(stats) for key, stats in results.items()}, f, indent=2)
+
+
+def read_baseline(baseline_filepath: str) -> dict[str, TimingStats]:
+    with open(baseline_filepath) as f:
+        return {key: TimingStats(**stats) for key, stats in json.load(f).items()}
+
+
+def find_regressions(
+    baseline: dict[str, TimingStats],
+    results: dict[str, TimingStats],
+    threshold: float,
+) -> list[str]:
+    """Runs whose median is slower than the baseline's by more than `threshold`."""
+    regressions: list[str] = []
+    for key, stats in results.items():
+        if key not in baseline:
+            continue
+        allowed_ns = baseline[key].median_ns * (1 + threshold)
+        if stats.median_ns > allowed_ns:
+            regressions.append(
+                f"{key}: median {format_ns(stats.median_ns)} vs baseline "
+                f"{format_ns(baseline[key].median_ns)} (threshold {threshold:.0%})"
+            )
+    return regressions
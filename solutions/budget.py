@@ -0,0 +1,53 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+CHECK_EVERY = 256
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+class NonOptimal(int):
+    """
+    The best answer a search had found when its time budget ran out. It is
+    achievable, but the search didn't get to prove that nothing beats it.
+    """
+
+    def __repr__(self) -> str:
+        return f"NonOptimal({int(self)})"
+
+
+@contextmanager
+def time_budget(seconds: float | None) -> Iterator[None]:
+    """
+    Searches that check `budget_expired` give up once `seconds` have passed
+    from here. Without a budget they run to the end, as they always have.
+    """
+    if seconds is None:
+        yield
+        return
+    token = _deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def budget_expired() -> bool:
+    """Cheap, but searches still only call it every `CHECK_EVERY` steps."""
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def flagged(value: int, *parts: int) -> int:
+    """`value` marked as non-optimal if anything it was made from was."""
+    if any(isinstance(part, NonOptimal) for part in parts):
+        return NonOptimal(value)
+    return value
+
+
+def is_optimal(answer: Any) -> bool:
+    if isinstance(answer, tuple):
+        return all(map(is_optimal, answer))
+    return not isinstance(answer, NonOptimal)
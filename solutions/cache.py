@@ -0,0 +1,161 @@
+import hashlib
+import importlib.util
+import io
+import os
+import pickle
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Any, Callable, TextIO
+
+from solutions.budget import is_optimal
+from solutions.inputs import solver_input
+from solutions.registry import day_module_name
+
+CACHE_DIR = os.environ.get("AOC_CACHE_DIR", ".solution_cache")
+MAX_CACHE_BYTES = int(os.environ.get("AOC_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    answer: Any
+    output: str
+
+
+class ResultCache:
+    """
+    Solver results on disk, one pickle per key. Reading a result bumps its
+    mtime, and the least recently used results are evicted once the cache
+    grows past `max_bytes`.
+    """
+
+    directory: str
+    max_bytes: int
+
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> CachedResult | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+            return None
+        return result
+
+    def put(self, key: str, result: CachedResult) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(temp_path, self._path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        entries: list[tuple[float, int, str]] = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pickle"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
+
+
+def cache_key(day_number: int, version: int, input_digest: str) -> str:
+    digest = hashlib.sha256(input_digest.encode())
+    digest.update(day_source_digest(day_number).encode())
+    digest.update(str(version).encode())
+    return digest.hexdigest()
+
+
+def day_source_digest(day_number: int) -> str:
+    """
+    Hash of a day's source, so that editing a day module invalidates its
+    cached results. Test files in a day package don't count.
+    """
+    spec = importlib.util.find_spec(f"solutions.{day_module_name(day_number)}")
+    if spec is None or spec.origin is None:
+        raise ModuleNotFoundError(day_module_name(day_number))
+    if spec.submodule_search_locations:
+        package_dir = os.path.dirname(spec.origin)
+        source_paths = [
+            os.path.join(package_dir, filename)
+            for filename in sorted(os.listdir(package_dir))
+            if filename.endswith(".py")
+            and not filename.startswith("test_")
+            and filename != "tests.py"
+        ]
+    else:
+        source_paths = [spec.origin]
+    digest = hashlib.sha256()
+    for source_path in source_paths:
+        with open(source_path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def solve_cached(
+    solver: Callable[[list[str], bool], Any],
+    day_number: int,
+    version: int,
+    input_filepath: str,
+    refresh: bool = False,
+    cache: ResultCache | None = None,
+) -> Any:
+    """
+    Anything the solver prints is stored with its answer and printed again
+    on a cache hit. The input is hashed in chunks rather than read whole, so a hit on a large
+    input costs no more memory than a small one. A pipe can only be read
+    once, so it's solved without the cache.
+    """
+    if not os.path.isfile(input_filepath):
+        with solver_input(solver, input_filepath) as inputs:
+            return solver(inputs, False)
+    cache = cache or ResultCache()
+    with open(input_filepath, "rb") as f:
+        input_digest = hashlib.file_digest(f, "sha256").hexdigest()
+    key = cache_key(day_number, version, input_digest)
+    cached = None if refresh else cache.get(key)
+    if cached is not None:
+        sys.stdout.write(cached.output)
+        return cached.answer
+    output = io.StringIO()
+    with solver_input(solver, input_filepath) as inputs:
+        with redirect_stdout(Tee(sys.stdout, output)):
+            answer = solver(inputs, False)
+    if is_optimal(answer):
+        cache.put(key, CachedResult(answer, output.getvalue()))
+    return answer
+
+
+class Tee(io.TextIOBase):
+    streams: tuple[TextIO, ...]
+
+    def __init__(self, *streams: TextIO) -> None:
+        self.streams = streams
+
+    def write(self, s: str) -> int:
+        for stream in self.streams:
+            stream.write(s)
+        return len(s)
+
+    def flush(self) -> None:
+        for stream in self.streams:
+            stream.flush()
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Any
+
+from solutions.registry import Solver
+from solutions.timing import TimingStats, format_ns, measure, quiet
+
+
+@dataclass(frozen=True)
+class VersionTiming:
+    version: int
+    name: str
+    answer: Any
+    stats: TimingStats
+
+
+class AnswerMismatchError(AssertionError):
+    def __init__(self, timings: list[VersionTiming]) -> None:
+        answers = ", ".join(f"v{t.version} {t.answer!r}" for t in timings)
+        super().__init__(f"Versions disagree: {answers}")
+
+
+def compare_versions(
+    solvers: list[Solver], input_strs: list[str], warmups: int = 1, repeats: int = 5
+) -> list[VersionTiming]:
+    """
+    Every version solves the same input the same number of times. Each gets
+    its own copy of the lines, in case one of them consumes its input.
+    """
+    timings: list[VersionTiming] = []
+    for version, solver in enumerate(solvers):
+        with quiet():
+            answer, stats = measure(
+                lambda: solver(list(input_strs), False),
+                warmups=warmups,
+                repeats=repeats,
+            )
+        timings.append(VersionTiming(version, solver.__name__, answer, stats))
+    if len({repr(timing.answer) for timing in timings}) > 1:
+        raise AnswerMismatchError(timings)
+    return timings
+
+
+def format_comparison(timings: list[VersionTiming]) -> list[str]:
+    """One row per version, with its speedup over version 0 by median time."""
+    base_ns = timings[0].stats.median_ns
+    lines = [f"{'version':<12} {'median':>14} {'min':>14} {'speedup':>8}"]
+    for timing in timings:
+        speedup = base_ns / (timing.stats.median_ns or 1)
+        lines.append(
+            f"{f'v{timing.version} {timing.name}':<12} "
+            f"{format_ns(timing.stats.median_ns):>14} "
+            f"{format_ns(timing.stats.min_ns):>14} {speedup:>7.2f}x"
+        )
+    return lines
@@ -0,0 +1,152 @@
+"""
+A long-lived solver process that keeps every day module imported and keeps
+warm caches (see `solutions.warm`) between requests, served over a Unix
+domain socket.
+
+Requests and responses are one JSON object per line:
+
+    {"day": 16, "version": 0, "input": "<puzzle input text>"}
+    {"answer": "(1651, 1707)", "output": "...", "elapsed_ms": 12.3, "error": null}
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+from typing import Any
+
+from solutions import warm
+from solutions.inputs import split_lines
+from solutions.parsing import ArgsModel, build_parser
+from solutions.registry import solution_functions
+from solutions.timing import solve_captured
+
+SOCKET_PATH = os.environ.get("AOC_SOCKET", f"/tmp/aoc-solutions-{os.getuid()}.sock")
+STREAM_LIMIT = 256 * 1024 * 1024
+
+
+def serve_main(argv: list[str]) -> None:
+    parser = build_parser(ServeArgs)
+    args = parser.parse(argv)
+    if socket_in_use(args.socket_path):
+        sys.exit(f"A daemon is already serving on {args.socket_path}")
+    warm.enable()
+    for day_number in solution_functions:
+        solution_functions[day_number]
+    asyncio.run(serve(args.socket_path))
+
+
+def client_main(argv: list[str]) -> None:
+    parser = build_parser(ClientArgs)
+    args = parser.parse(argv)
+    with open(args.input_filepath) as f:
+        input_text = f.read()
+    response = request(args.day_number, args.version, input_text, args.socket_path)
+    sys.stdout.write(response["output"])
+    if response["error"] is not None:
+        print(response["error"], file=sys.stderr)
+        sys.exit(1)
+    print(response["answer"])
+    if args.timeit:
+        print(f"Server solve time: {response['elapsed_ms'] / 1000}")
+
+
+class ServeArgs(ArgsModel):
+    socket_path: str = SOCKET_PATH
+
+    class Meta:
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {
+            "socket_path": "socket",
+        }
+
+
+class ClientArgs(ArgsModel):
+    day_number: int
+    input_filepath: str
+    version: int = 0
+    socket_path: str = SOCKET_PATH
+    timeit: bool
+
+    class Meta:
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {
+            "version": ("v", "version"),
+            "socket_path": "socket",
+        }
+
+
+class SocketInUseError(OSError):
+    def __init__(self, socket_path: str) -> None:
+        super().__init__(f"A daemon is already serving on {socket_path}")
+
+
+def socket_in_use(socket_path: str) -> bool:
+    """Whether something is accepting connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+    return True
+
+
+async def serve(socket_path: str) -> None:
+    """
+    A socket file left behind by a daemon that died is replaced, but one that
+    a running daemon is still serving on is not.
+    """
+    if socket_in_use(socket_path):
+        raise SocketInUseError(socket_path)
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    # Solvers share module state and stdout, so they run one at a time.
+    lock = asyncio.Lock()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                async with lock:
+                    response = await asyncio.to_thread(handle_request, line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_unix_server(handle, socket_path, limit=STREAM_LIMIT)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    print(f"Serving on {socket_path}", flush=True)
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        os.remove(socket_path)
+
+
+def handle_request(line: bytes) -> dict[str, Any]:
+    with solve_captured() as solved:
+        payload = json.loads(line)
+        solver = solution_functions[payload["day"]][payload.get("version", 0)]
+        inputs = split_lines(payload["input"])
+        solved.time(lambda: solver(inputs, False))
+    return {
+        "answer": solved.answer,
+        "output": solved.output,
+        "elapsed_ms": solved.elapsed_ns / 1_000_000,
+        "error": solved.error,
+    }
+
+
+def request(
+    day_number: int, version: int, input_text: str, socket_path: str = SOCKET_PATH
+) -> dict[str, Any]:
+    """Sends one request to a running daemon and waits for its response."""
+    payload = {"day": day_number, "version": version, "input": input_text}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as response:
+            return json.loads(response.readline())
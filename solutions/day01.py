@@ -1,17 +1,205 @@
-def alpha(inputs: list[str], debug: bool = False) -> tuple[int, int]:
-    elves: list[int] = []
-    elf = 0
-    for line in inputs:
+import heapq
+import math
+import os
+import re
+from collections import Counter
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from solutions.inputs import input_kind
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+BLANK_LINE_RE = re.compile(rb"\r?\n\r?\n")
+CHUNK_BYTES = 16 * 1024 * 1024
+
+
+@input_kind("lines")
+def alpha(inputs: Iterable[str], debug: bool = False) -> tuple[int, int]:
+    top_three = top_totals(group_totals(inputs), 3)
+    part_one = top_three[0]
+
+    part_two = sum(top_three)
+
+    return part_one, part_two
+
+
+@input_kind("bytes")
+def beta(inputs: list[str] | memoryview, debug: bool = False) -> tuple[int, int]:
+    data = "\n".join(inputs).encode() if isinstance(inputs, list) else bytes(inputs)
+    top_three = top_totals(bulk_group_totals(data), 3)
+    return top_three[0], sum(top_three)
+
+
+@input_kind("bytes")
+def gamma(inputs: list[str] | memoryview, debug: bool = False) -> tuple[int, int]:
+    data = "\n".join(inputs).encode() if isinstance(inputs, list) else inputs
+    top_three = parallel_top_totals(data, 3)
+    return top_three[0], sum(top_three)
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of a stream of non-negative totals, in the style
+    of DDSketch. Totals are counted in buckets whose bounds grow by a factor
+    of `gamma`, so a quantile is answered within `relative_error` of the
+    true total, and the number of buckets grows with the log of the largest
+    total rather than with the number of totals. Sketches of parts of a
+    stream can be merged.
+    """
+
+    relative_error: float
+    gamma: float
+    count: int
+    zeros: int
+    buckets: Counter[int]
+
+    def __init__(self, relative_error: float = 0.01) -> None:
+        if not 0 < relative_error < 1:
+            raise ValueError(f"Relative error must be in (0, 1): {relative_error}")
+        self.relative_error = relative_error
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self.gamma)
+        self.count = 0
+        self.zeros = 0
+        self.buckets = Counter()
+
+    def add(self, total: int) -> None:
+        """Bucket `i` holds the totals in `(gamma ** (i - 1), gamma ** i]`."""
+        if total < 0:
+            raise ValueError(f"Totals can't be negative: {total}")
+        self.count += 1
+        if total == 0:
+            self.zeros += 1
+        else:
+            self.buckets[math.ceil(math.log(total) / self._log_gamma)] += 1
+
+    def update(self, totals: Iterable[int]) -> "QuantileSketch":
+        for total in totals:
+            self.add(total)
+        return self
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.relative_error != self.relative_error:
+            raise ValueError("Only sketches with the same relative error can merge")
+        self.count += other.count
+        self.zeros += other.zeros
+        self.buckets.update(other.buckets)
+
+    def quantile(self, q: float) -> float:
+        """
+        An estimate of the total at rank `q * (count - 1)` in sorted order, as
+        the middle of its bucket in relative terms.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantiles must be in [0, 1]: {q}")
+        if self.count == 0:
+            raise ValueError("An empty sketch has no quantiles")
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                break
+        return 2 * self.gamma**index / (self.gamma + 1)
+
+
+def total_quantiles(
+    lines: Iterable[str], quantiles: Iterable[float], relative_error: float = 0.01
+) -> dict[float, float]:
+    """E.g. the median and p99 elf totals of a stream, in one pass."""
+    sketch = QuantileSketch(relative_error).update(group_totals(lines))
+    return {q: sketch.quantile(q) for q in quantiles}
+
+
+def group_totals(lines: Iterable[str]) -> Iterator[int]:
+    """Each elf's total, as soon as the blank line after it is read."""
+    total = 0
+    for line in lines:
         if not line:
-            elves.append(elf)
-            elf = 0
+            yield total
+            total = 0
         else:
-            elf += int(line)
-    elves.append(elf)
+            total += int(line)
+    yield total
 
-    elves.sort()
-    part_one = elves[-1]
 
-    part_two = sum(elves[-3:])
+def top_totals(totals: Iterable[int], k: int) -> list[int]:
+    """
+    The `k` largest totals, largest first, in one pass. Only a heap of `k`
+    totals is kept, so memory doesn't grow with the number of elves.
+    """
+    return heapq.nlargest(k, totals)
 
-    return part_one, part_two
+
+def bulk_group_totals(data: bytes) -> Iterator[int]:
+    """
+    Each elf's total, with the splitting and number parsing done by bytes
+    methods and `int` in C rather than a Python loop over lines. Runs of
+    blank lines don't make empty groups as they do in `group_totals`, but
+    an empty group totals 0, so the top totals are the same.
+    """
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n")
+    for group in data.split(b"\n\n"):
+        yield sum(map(int, group.split()))
+
+
+def chunk_bounds(data: bytes | memoryview, chunks: int) -> list[tuple[int, int]]:
+    """
+    Byte ranges of about `len(data) / chunks` each. Each range but the last
+    ends just after a blank line, so no elf's group is split between two.
+    """
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    for chunk in range(1, chunks):
+        match = BLANK_LINE_RE.search(data, max(start, len(data) * chunk // chunks))
+        if match is None:
+            break
+        bounds.append((start, match.end()))
+        start = match.end()
+    bounds.append((start, len(data)))
+    return bounds
+
+
+def chunk_top_totals(chunk: bytes, k: int) -> list[int]:
+    return top_totals(bulk_group_totals(chunk), k)
+
+
+def parallel_top_totals(
+    data: bytes | memoryview,
+    k: int,
+    workers: int | None = None,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> list[int]:
+    """
+    The `k` largest totals, from each chunk's own top `k` reduced in a
+    process pool and merged here. Chunks are copied to the workers, so only
+    two per worker are sent at a time, to bound memory on huge inputs. An
+    input of one chunk isn't worth starting processes for.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = -(-len(data) // chunk_bytes)
+    if workers == 1 or chunks <= 1:
+        return chunk_top_totals(bytes(data), k)
+    # Imported here because multiprocessing would double day 1's import time.
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    top: list[int] = []
+    with ProcessPoolExecutor(workers) as executor:
+        pending: "set[Future[list[int]]]" = set()
+        for start, end in chunk_bounds(data, chunks):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                top = merge_tops(top, done, k)
+            pending.add(executor.submit(chunk_top_totals, bytes(data[start:end]), k))
+        return merge_tops(top, wait(pending).done, k)
+
+
+def merge_tops(
+    top: list[int], done: "Iterable[Future[list[int]]]", k: int
+) -> list[int]:
+    return top_totals(chain(top, *(future.result() for future in done)), k)
@@ -1,4 +1,8 @@
+from collections import Counter
 from enum import Enum
+from typing import Iterable
+
+from solutions.inputs import input_kind
 
 
 class Outcome(Enum):
@@ -41,9 +45,15 @@ class NeededOutcome(Enum):
 OUTCOME_TO_MOD: dict[Outcome, int] = {Outcome.WIN: 1, Outcome.DRAW: 0, Outcome.LOSE: 2}
 
 
-def alpha(inputs: list[str], debug: bool = False) -> tuple[int, int]:
-    part1 = sum(round_score_part1(*line.split(" ")) for line in inputs)
-    part2 = sum(round_score_part2(*line.split(" ")) for line in inputs)
+@input_kind("lines")
+def alpha(inputs: Iterable[str], debug: bool = False) -> tuple[int, int]:
+    """
+    There are only nine different rounds, so they're counted and each part
+    is the sum of a round's count times its score from a table.
+    """
+    rounds = Counter(inputs)
+    part1 = sum(count * PART_ONE_SCORES[round_] for round_, count in rounds.items())
+    part2 = sum(count * PART_TWO_SCORES[round_] for round_, count in rounds.items())
     return part1, part2
 
 
@@ -60,3 +70,14 @@ def round_score_part2(opponent: str, outcome: str) -> int:
         needed_outcome.needed_move(MoveOpp[opponent].value).value
         + needed_outcome.value.value
     )
+
+
+ROUNDS = [
+    f"{opponent} {self_or_outcome}" for opponent in "ABC" for self_or_outcome in "XYZ"
+]
+PART_ONE_SCORES: dict[str, int] = {
+    round_: round_score_part1(*round_.split(" ")) for round_ in ROUNDS
+}
+PART_TWO_SCORES: dict[str, int] = {
+    round_: round_score_part2(*round_.split(" ")) for round_ in ROUNDS
+}
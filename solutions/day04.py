@@ -1,10 +1,16 @@
 import re
+from typing import Iterable
 
+from solutions.inputs import input_kind
 
-def alpha(inputs: list[str], debug: bool = False) -> tuple[int, int]:
-    pairs = list(map(SectionPair.from_input_row, inputs))
-    part1 = sum(pair.fully_overlaps() for pair in pairs)
-    part2 = sum(pair.overlaps_at_all() for pair in pairs)
+
+@input_kind("lines")
+def alpha(inputs: Iterable[str], debug: bool = False) -> tuple[int, int]:
+    part1 = 0
+    part2 = 0
+    for pair in map(SectionPair.from_input_row, inputs):
+        part1 += pair.fully_overlaps()
+        part2 += pair.overlaps_at_all()
     return part1, part2
 
 
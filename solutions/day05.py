@@ -1,17 +1,21 @@
 import re
 
+from solutions.inputs import input_kind
+from solutions.tracing import channel
 
+
+@input_kind("packed")
 def alpha(inputs: list[str], debug: bool = False) -> tuple[str, str]:
     break_line = inputs.index("")
     diagram = inputs[:break_line]
     instructions = inputs[break_line + 1 :]
 
     crane = Crane(diagram)
-    crane.do_all_instructions(instructions, debug=debug)
+    crane.do_all_instructions(instructions)
     part1 = crane.top_crates
 
     adv_crane = Crane(diagram, advanced=True)
-    adv_crane.do_all_instructions(instructions, debug=debug)
+    adv_crane.do_all_instructions(instructions)
     part2 = adv_crane.top_crates
 
     return part1, part2
@@ -36,18 +40,17 @@ class Crane:
     def top_crates(self) -> str:
         return "".join(s[-1] for s in self.stacks)
 
-    def do_all_instructions(self, instructions: list[str], debug: bool = False):
-        if debug:
-            self.print_state()
+    def do_all_instructions(self, instructions: list[str]):
+        trace = channel("day05.stacks")
+        if trace:
+            trace(stacks=self.stack_strings())
         for instruction in instructions:
             self.do_instruction(instruction)
-            if debug:
-                self.print_state()
+            if trace:
+                trace(instruction=instruction, stacks=self.stack_strings())
 
-    def print_state(self) -> None:
-        for i, s in enumerate(self.stacks):
-            print(f"{i + 1}: {s}")
-        print("==========")
+    def stack_strings(self) -> list[str]:
+        return ["".join(s) for s in self.stacks]
 
     def do_instruction(self, instruction: str):
         m = re.match(self.INSTRUCTION_RE, instruction)
@@ -1,13 +1,16 @@
 from enum import Enum
 from typing import Any
 
+from solutions.tracing import Channel, channel
+
 
 def alpha(inputs: list[str], debug: bool) -> tuple[int, int]:
     movements = (
         (Direction[letter], int(count)) for letter, count in map(str.split, inputs)
     )
+    trace_head = channel("day09.head")
     head_address = Address((0, 0))
-    tails = [Tail(debug and x == 8) for x in range(9)]
+    tails = [Tail(channel("day09.tail") if x == 8 else None) for x in range(9)]
     for direction, count in movements:
         for _ in range(count):
             head_address += direction.value
@@ -15,8 +18,8 @@ def alpha(inputs: list[str], debug: bool) -> tuple[int, int]:
             for tail in tails:
                 tail.follow(lead)
                 lead = tail.address
-            if debug:
-                print(f"h: {head_address}")
+            if trace_head:
+                trace_head(address=head_address)
     part1 = len(tails[0].visited)
     part2 = len(tails[-1].visited)
     return part1, part2
@@ -26,6 +29,8 @@ def beta(inputs: list[str], debug: bool) -> tuple[int, int]:
     movements = (
         (Direction[letter], int(count)) for letter, count in map(str.split, inputs)
     )
+    trace_head = channel("day09.head")
+    trace_tail = channel("day09.tail")
     knots = [Address((0, 0)) for _ in range(10)]
     second_visits = {Address((0, 0))}
     tenth_visits = {Address((0, 0))}
@@ -34,12 +39,12 @@ def beta(inputs: list[str], debug: bool) -> tuple[int, int]:
             knots[0] += direction.value
             for k in range(1, 10):
                 knots[k] = knots[k].follow(knots[k - 1])
-            if debug and knots[9] not in tenth_visits:
-                print(knots[9])
+            if trace_tail and knots[9] not in tenth_visits:
+                trace_tail(address=knots[9])
             second_visits.add(knots[1])
             tenth_visits.add(knots[9])
-            if debug:
-                print(f"h: {knots[0]}")
+            if trace_head:
+                trace_head(address=knots[0])
     part1 = len(second_visits)
     part2 = len(tenth_visits)
     return part1, part2
@@ -71,17 +76,17 @@ class Address(tuple[int, int]):
 class Tail:
     address: Address
     visited: set[Address]
-    debug: bool
+    trace: Channel | None
 
-    def __init__(self, debug: bool = False) -> None:
+    def __init__(self, trace: Channel | None = None) -> None:
         self.address = Address((0, 0))
         self.visited = {self.address}
-        self.debug = debug
+        self.trace = trace
 
     def follow(self, head_address: tuple[int, int]) -> None:
         dx, dy = [h - t for h, t in zip(head_address, self.address)]
         if not (-2 < dx < 2 and -2 < dy < 2):
             self.address += (dx and dx // abs(dx), dy and dy // abs(dy))
-            if self.debug and self.address not in self.visited:
-                print(self.address)
+            if self.trace and self.address not in self.visited:
+                self.trace(address=self.address)
             self.visited.add(self.address)
@@ -1,38 +1,42 @@
-from typing import Protocol
+from typing import Iterable, Protocol
 
+from solutions.inputs import input_kind
 
-def alpha(inputs: list[str], debug: bool) -> tuple[int, int]:
+CYCLE_POINTS = frozenset((20, 60, 100, 140, 180, 220))
+
+
+@input_kind("lines")
+def alpha(inputs: Iterable[str], debug: bool) -> tuple[int, int]:
     instructions_lookup: dict[str, Instruction] = {
         func.__name__: func for func in (noop, addx)
     }
     register = 1
     strength = 0
-    cycle_values = []
+    cycle = 0
+    # Only the row being drawn is kept, so memory doesn't grow with the input
+    row: list[str] = []
+    register_row: list[str] = []
     for instr_name, *args in map(str.split, inputs):
         new_register, dc = instructions_lookup[instr_name](register, *args)
-        cycle_values.extend([register] * dc)
+        for _ in range(dc):
+            cycle += 1
+            if cycle in CYCLE_POINTS:
+                strength += cycle * register
+            row.append("#" if abs(register - len(row)) <= 1 else " ")
+            if debug:
+                register_row.append(str(register))
+            if len(row) == 40:
+                if debug:
+                    print("-".join(register_row))
+                    register_row.clear()
+                # Part 2 is visual and the answer must be read from stdout
+                print("".join(row))
+                row.clear()
         register = new_register
-
-    cycle_points = [20, 60, 100, 140, 180, 220]
-    strength = sum(point * cycle_values[point - 1] for point in cycle_points)
+    if row or not cycle:
+        print("".join(row))
     part1 = strength
 
-    # Part 2 is visual and the answer must be read from stdout
-    if debug:
-        s = "\n".join(map("-".join, zip(*[map(str, cycle_values)] * 40)))
-        print(s)
-    lit_gen = (abs(reg - (i % 40)) <= 1 for i, reg in enumerate(cycle_values))
-    screen: list[list[str]] = [[]]
-    for lit in lit_gen:
-        if len(screen[-1]) == 40:
-            screen.append([])
-        if lit:
-            screen[-1].append("#")
-        else:
-            screen[-1].append(" ")
-    image = "\n".join(map("".join, screen))
-    print(image)
-
     part2 = 0
     return part1, part2
 
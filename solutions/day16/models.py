@@ -1,32 +1,13 @@
-import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from functools import cached_property
 from itertools import islice, product
-from typing import Callable, Iterator, TypeVar
+from typing import Iterator, TypeVar
 
-TIME_LIMIT = 30
-TIMERS: dict[str, float] = {}
-CURRENTLY_TIMED: set[str] = set()
-
-C = TypeVar("C", bound=Callable)
-
-
-def classtimer(func: C) -> C:
-    def wrapper(self, *args, **kwargs):
-        key = f"{self.__class__.__name__}.{func.__name__}"
-        if key not in CURRENTLY_TIMED:
-            CURRENTLY_TIMED.add(key)
-            start = time.time()
-            value = func(self, *args, **kwargs)
-            stop = time.time()
-            TIMERS[key] = TIMERS.get(key, 0) + stop - start
-            CURRENTLY_TIMED.remove(key)
-        else:
-            value = func(self, *args, **kwargs)
-        return value
+from solutions.budget import budget_expired
+from solutions.profiling import hot_path
 
-    return wrapper  # type: ignore
+TIME_LIMIT = 30
 
 
 @dataclass(frozen=True)
@@ -65,7 +46,7 @@ class Network:
     def sorted_valves(self) -> tuple[Valve, ...]:
         return tuple(sorted(self.valves.values(), key=lambda v: v.rate, reverse=True))
 
-    @classtimer
+    @hot_path
     def distance(self, start: Valve, end: Valve) -> int:
         key = (start.name, end.name)
         if key in self._dist_cache:
@@ -259,7 +240,7 @@ class DoublePath(BasePath):
     def __repr__(self) -> str:
         return super().__repr__()
 
-    @classtimer
+    @hot_path
     def calculate_maximum_value(self) -> int:
         on_valve = any(loc not in self.valves_opened for loc in self.location)
         maximum_opened = (self.time_left + on_valve) // 2 * 2
@@ -287,7 +268,7 @@ class DoublePath(BasePath):
         time_open = self.time_left - distance - 1
         return time_open * valve.rate
 
-    @classtimer
+    @hot_path
     def next_iterations(self) -> list["DoublePath"]:
         if self.minute == self.time_limit:
             return [
@@ -349,7 +330,11 @@ class DoublePath(BasePath):
         iterations: list[DoublePath] = []
         for hum, ele in product(human_moves, elephant_moves):
             action = self.act(human_move=hum, elephant_move=ele)
-            if action.minute < self.time_limit + 1 and action.noop_state():
+            if (
+                action.minute < self.time_limit + 1
+                and action.noop_state()
+                and not budget_expired()
+            ):
                 iterations.extend(action.next_iterations())
             else:
                 iterations.append(action)
@@ -361,7 +346,7 @@ class DoublePath(BasePath):
     def noop_valve(self, valve: Valve) -> bool:
         return valve.rate == 0 or valve in self.valves_opened
 
-    @classtimer
+    @hot_path
     def act(
         self, *, human_move: Valve | None = None, elephant_move: Valve | None = None
     ) -> "DoublePath":
@@ -1,8 +1,15 @@
 import re
+from typing import Iterable
 
 from sortedcontainers import SortedList
 
-from .models import TIMERS, DoublePath, Network, Path, Valve
+from solutions.budget import CHECK_EVERY, NonOptimal, budget_expired
+from solutions.metrics import SearchMetrics
+from solutions.parts import staged
+from solutions.tracing import channel
+from solutions.warm import warm_cache
+
+from .models import BasePath, DoublePath, Network, Path, Valve
 
 LINE_REGEX = (
     r"Valve (?P<name>\w\w) has flow rate=(?P<rate>\d+); "
@@ -10,23 +17,27 @@ LINE_REGEX = (
 )
 
 
+def part_one(parsed: tuple[Network, Valve]) -> int:
+    network, starting_valve = parsed
+    return part_one_alpha(network=network, starting_valve=starting_valve)
+
+
+def part_two(parsed: tuple[Network, Valve]) -> int:
+    network, starting_valve = parsed
+    return part_two_alpha(network=network, starting_valve=starting_valve)
+
+
+@staged(parse=lambda inputs: parse_network(inputs), part1=part_one, part2=part_two)
 def alpha(inputs: list[str], debug: bool) -> tuple[int, int]:
-    connections: list[tuple[str, str]] = []
-    valves_by_name: dict[str, Valve] = {}
-    for line in inputs:
-        valve, line_connections = parse_line(line)
-        connections.extend((valve.name, conn) for conn in line_connections)
-        valves_by_name[valve.name] = valve
-    network = Network(valves_by_name, connections)
-    starting_valve = valves_by_name["AA"]
-    part1 = part_one_alpha(network=network, starting_valve=starting_valve, debug=debug)
+    parsed = parse_network(inputs)
+    part1 = part_one(parsed)
     print("=" * 30)
-    part2 = part_two_alpha(network=network, starting_valve=starting_valve, debug=debug)
+    part2 = part_two(parsed)
     print("=" * 30)
     return part1, part2
 
 
-def part_one_alpha(network: Network, starting_valve: Valve, debug: bool) -> int:
+def part_one_alpha(network: Network, starting_valve: Valve) -> int:
     paths = SortedList(
         [
             Path(
@@ -39,128 +50,187 @@ def part_one_alpha(network: Network, starting_valve: Valve, debug: bool) -> int:
         ],
         key=lambda p: p.maximum_value,
     )
+    trace_summary = channel("day16.summary")
+    metrics = SearchMetrics("day16.part1")
     best_complete_path: Path | None = None
     count = 0
     max_paths_length = 0
+    expanded = 0
+    pruned_by_bound = 0
     while paths:
         count += 1
+        if count % CHECK_EVERY == 0 and budget_expired():
+            break
         max_paths_length = max(max_paths_length, len(paths))
         best_incomplete_path: Path = paths.pop()
         if best_complete_path is not None:
             if best_incomplete_path.maximum_value < best_complete_path.current_value:
+                pruned_by_bound += len(paths) + 1
                 break
 
         new_paths = best_incomplete_path.next_iterations()
+        expanded += 1
         for path in new_paths:
             if path.complete:
                 if best_complete_path is None:
                     best_complete_path = path
+                    metrics.found_incumbent()
                 elif best_complete_path.current_value < path.current_value:
                     best_complete_path = path
             else:
                 paths.add(path)
-    debug and print(f"Tried {count} path steps")
-    debug and print(f"Candidates paths was at most {max_paths_length}")
+    metrics.nodes_expanded = expanded
+    metrics.pruned_by_bound = pruned_by_bound
+    metrics.peak_frontier = max_paths_length
+    metrics.finish()
+    if trace_summary:
+        trace_summary(part=1, steps=count, max_candidates=max_paths_length)
+    if budget_expired():
+        return best_so_far(best_complete_path, paths)
     assert best_complete_path is not None
     return best_complete_path.current_value
 
 
-def part_two_alpha(network: Network, starting_valve: Valve, debug: bool) -> int:
-    try:
-        double_paths = SortedList(
-            [
-                DoublePath(
-                    network=network,
-                    valves_opened={},
-                    minute=1,
-                    location=(starting_valve, starting_valve),
-                    current_travel=(set(), set()),
-                )
-            ],
-            key=lambda p: p.maximum_value,
-        )
-        best_complete_double_path: DoublePath | None = None
-        count = 0
-        max_paths_length = 0
-        """
-        If path A and path B have the same valves opened
-        and path A and path B have the same location
-        and path A's minute is at least path B's minute
-        and path A's current value is less than path B's
-        then path A cannot beat path B and should be discarded
-        """
-        # opened, location
-        visited: dict[tuple[frozenset[Valve], frozenset[Valve]], list[DoublePath]] = {
-            visited_key(double_paths[0]): [double_paths[0]]
-        }
-        while double_paths:
-            count += 1
-            if debug and (count % 1000 == 0):
-                print(f"Path step {count}")
-                print(f"Best maximum: {double_paths[-1].maximum_value}")
-                print(f"Paths remaining: {len(double_paths)}")
-            max_paths_length = max(max_paths_length, len(double_paths))
-            best_incomplete_double_path: DoublePath | None = None
-            while best_incomplete_double_path is None:
-                best_incomplete_double_path = double_paths.pop()
-                cand_key = visited_key(best_incomplete_double_path)
-                if best_incomplete_double_path not in visited[cand_key]:
-                    best_incomplete_double_path = None
-            if best_complete_double_path is not None:
+def part_two_alpha(network: Network, starting_valve: Valve) -> int:
+    double_paths = SortedList(
+        [
+            DoublePath(
+                network=network,
+                valves_opened={},
+                minute=1,
+                location=(starting_valve, starting_valve),
+                current_travel=(set(), set()),
+            )
+        ],
+        key=lambda p: p.maximum_value,
+    )
+    trace_search = channel("day16.search")
+    trace_best = channel("day16.best")
+    trace_summary = channel("day16.summary")
+    metrics = SearchMetrics("day16.part2")
+    best_complete_double_path: DoublePath | None = None
+    count = 0
+    max_paths_length = 0
+    expanded = 0
+    pruned_by_bound = 0
+    pruned_by_dominance = 0
+    """
+    If path A and path B have the same valves opened
+    and path A and path B have the same location
+    and path A's minute is at least path B's minute
+    and path A's current value is less than path B's
+    then path A cannot beat path B and should be discarded
+    """
+    # opened, location
+    visited: dict[tuple[frozenset[Valve], frozenset[Valve]], list[DoublePath]] = {
+        visited_key(double_paths[0]): [double_paths[0]]
+    }
+    while double_paths:
+        count += 1
+        if count % CHECK_EVERY == 0 and budget_expired():
+            break
+        if trace_search:
+            trace_search(
+                step=count,
+                best_maximum=double_paths[-1].maximum_value,
+                remaining=len(double_paths),
+            )
+        max_paths_length = max(max_paths_length, len(double_paths))
+        best_incomplete_double_path: DoublePath | None = None
+        while best_incomplete_double_path is None:
+            best_incomplete_double_path = double_paths.pop()
+            cand_key = visited_key(best_incomplete_double_path)
+            if best_incomplete_double_path not in visited[cand_key]:
+                best_incomplete_double_path = None
+                pruned_by_dominance += 1
+        if best_complete_double_path is not None:
+            if (
+                best_incomplete_double_path.maximum_value
+                < best_complete_double_path.current_value
+            ):
+                pruned_by_bound += len(double_paths) + 1
+                break
+        new_double_paths = best_incomplete_double_path.next_iterations()
+        expanded += 1
+        for double_path in new_double_paths:
+            if double_path.complete:
                 if (
-                    best_incomplete_double_path.maximum_value
-                    < best_complete_double_path.current_value
+                    best_complete_double_path is None
+                    or best_complete_double_path.current_value
+                    < double_path.current_value
                 ):
-                    break
-            new_double_paths = best_incomplete_double_path.next_iterations()
-            for double_path in new_double_paths:
-                if double_path.complete:
-                    if (
-                        best_complete_double_path is None
-                        or best_complete_double_path.current_value
-                        < double_path.current_value
-                    ):
-                        best_complete_double_path = double_path
-                        debug and print(
-                            f"New best: {best_complete_double_path.current_value}"
-                        )
+                    best_complete_double_path = double_path
+                    metrics.found_incumbent()
+                    if trace_best:
+                        trace_best(step=count, value=double_path.current_value)
+            else:
+                baseline: int
+                if best_complete_double_path is not None:
+                    baseline = best_complete_double_path.current_value
+                elif len(double_paths) > 0:
+                    baseline = double_paths[-1].current_value
                 else:
-                    baseline: int
-                    if best_complete_double_path is not None:
-                        baseline = best_complete_double_path.current_value
-                    elif len(double_paths) > 0:
-                        baseline = double_paths[-1].current_value
-                    else:
-                        baseline = 0
-                    if double_path.maximum_value > baseline:
-                        key = visited_key(double_path)
-                        if key not in visited:
-                            visited[key] = [double_path]
-                            double_paths.add(double_path)
-                        elif not any(
-                            vp.minute <= double_path.minute
-                            and double_path.current_value <= vp.current_value
+                    baseline = 0
+                if double_path.maximum_value > baseline:
+                    key = visited_key(double_path)
+                    if key not in visited:
+                        visited[key] = [double_path]
+                        double_paths.add(double_path)
+                    elif not any(
+                        vp.minute <= double_path.minute
+                        and double_path.current_value <= vp.current_value
+                        for vp in visited[key]
+                    ):
+                        visited[key] = [
+                            vp
                             for vp in visited[key]
-                        ):
-                            visited[key] = [
-                                vp
-                                for vp in visited[key]
-                                if double_path.minute <= vp.minute
-                                and vp.current_value <= double_path.current_value
-                            ]
-                            visited[key].append(double_path)
-                            double_paths.add(double_path)
-        debug and print(f"Tried {count} path steps")
-        debug and print(f"Candidates paths was at most {max_paths_length}")
-        assert best_complete_double_path is not None
-        return best_complete_double_path.current_value
-
-    finally:
-        if debug:
-            busiest_functions = sorted(TIMERS, key=lambda k: TIMERS[k])[-3:]
-            for func_key in busiest_functions:
-                print(f"{func_key}: {TIMERS[func_key]}")
-            print(sum(TIMERS.values()))
+                            if double_path.minute <= vp.minute
+                            and vp.current_value <= double_path.current_value
+                        ]
+                        visited[key].append(double_path)
+                        double_paths.add(double_path)
+                    else:
+                        pruned_by_dominance += 1
+                else:
+                    pruned_by_bound += 1
+    metrics.nodes_expanded = expanded
+    metrics.pruned_by_bound = pruned_by_bound
+    metrics.pruned_by_dominance = pruned_by_dominance
+    metrics.peak_frontier = max_paths_length
+    metrics.finish()
+    if trace_summary:
+        trace_summary(part=2, steps=count, max_candidates=max_paths_length)
+    if budget_expired():
+        return best_so_far(best_complete_double_path, double_paths)
+    assert best_complete_double_path is not None
+    return best_complete_double_path.current_value
+
+
+def best_so_far(
+    best_complete: BasePath | None, candidates: Iterable[BasePath]
+) -> NonOptimal:
+    """
+    Any path's current value is achievable, since the valves it has opened
+    keep flowing until the end, so an unfinished search still has an answer.
+    A search that ran past its deadline may also have skipped expanding some
+    paths, so even if it finished it can't claim to be optimal.
+    """
+    values = [path.current_value for path in candidates]
+    if best_complete is not None:
+        values.append(best_complete.current_value)
+    return NonOptimal(max(values, default=0))
+
+
+@warm_cache
+def parse_network(inputs: list[str]) -> tuple[Network, Valve]:
+    connections: list[tuple[str, str]] = []
+    valves_by_name: dict[str, Valve] = {}
+    for line in inputs:
+        valve, line_connections = parse_line(line)
+        connections.extend((valve.name, conn) for conn in line_connections)
+        valves_by_name[valve.name] = valve
+    network = Network(valves_by_name, connections)
+    return network, valves_by_name["AA"]
 
 
 def parse_line(line: str) -> tuple[Valve, list[str]]:
@@ -2,6 +2,11 @@ import re
 
 from sortedcontainers import SortedList
 
+from solutions.budget import CHECK_EVERY, NonOptimal, budget_expired, flagged
+from solutions.metrics import SearchMetrics
+from solutions.parts import staged
+from solutions.tracing import channel
+
 from .models import Blueprint, FactoryState, Resource, ResourceSet
 
 BLUEPRINT_PATTERN = (
@@ -14,21 +19,35 @@ PART_ONE_TIME_LIMIT = 24
 PART_TWO_TIME_LIMIT = 32
 
 
-def alpha(inputs: list[str], debug: bool = False) -> tuple[int, int]:
-    initial_factory_states = list(map(build_initial_state, inputs))
+def parse_factories(inputs: list[str]) -> list[FactoryState]:
+    return list(map(build_initial_state, inputs))
+
 
+def part_one(initial_factory_states: list[FactoryState]) -> int:
     quality = 0
+    part_one_geodes: list[int] = []
     for initial_state in initial_factory_states:
-        max_geodes = maximize_geodes(initial_state, PART_ONE_TIME_LIMIT, debug)
+        max_geodes = maximize_geodes(initial_state, PART_ONE_TIME_LIMIT)
         quality += initial_state.blueprint.number * max_geodes
-    part1 = quality
+        part_one_geodes.append(max_geodes)
+    return flagged(quality, *part_one_geodes)
 
+
+def part_two(initial_factory_states: list[FactoryState]) -> int:
     product = 1
+    part_two_geodes: list[int] = []
     for initial_state in initial_factory_states[:3]:
-        max_geodes = maximize_geodes(initial_state, PART_TWO_TIME_LIMIT, debug)
+        max_geodes = maximize_geodes(initial_state, PART_TWO_TIME_LIMIT)
         product *= max_geodes
-    part2 = product
+        part_two_geodes.append(max_geodes)
+    return flagged(product, *part_two_geodes)
+
 
+@staged(parse=parse_factories, part1=part_one, part2=part_two)
+def alpha(inputs: list[str], debug: bool = False) -> tuple[int, int]:
+    initial_factory_states = parse_factories(inputs)
+    part1 = part_one(initial_factory_states)
+    part2 = part_two(initial_factory_states)
     return part1, part2
 
 
@@ -51,11 +70,20 @@ def parse_blueprint(input_line: str) -> Blueprint:
     return blueprint
 
 
-def maximize_geodes(initial_state: FactoryState, time_limit: int, debug: bool) -> int:
+def maximize_geodes(initial_state: FactoryState, time_limit: int) -> int:
     frontier = SortedList([(initial_state, time_limit)], key=sort_key)
+    trace = channel("day19.frontier")
+    metrics = SearchMetrics(
+        f"day19.blueprint{initial_state.blueprint.number}.{time_limit}min"
+    )
     best_state: FactoryState | None = None
     ticker = 0
+    expanded = 0
+    pruned_by_bound = 0
+    peak_frontier = 1
     while len(frontier) > 0:
+        if ticker % CHECK_EVERY == 0 and budget_expired():
+            break
         candidate_time: tuple[FactoryState, int] = frontier.pop()
         candidate, time_left = candidate_time
         if time_left <= 0:
@@ -64,21 +92,45 @@ def maximize_geodes(initial_state: FactoryState, time_limit: int, debug: bool) -
                 or best_state.resources.geode < candidate.resources.geode
             ):
                 best_state = candidate
+                metrics.found_incumbent()
         else:
             if (
                 best_state is not None
                 and best_state.resources.geode >= candidate.heuristic(time_left)
             ):
+                pruned_by_bound += len(frontier) + 1
                 break
             frontier.update(candidate.branch(time_left))
+            expanded += 1
+            peak_frontier = max(peak_frontier, len(frontier))
         ticker += 1
-        debug and ticker % 1000 == 0 and print(
-            ticker, len(frontier), best_state and best_state.resources
-        )
+        if trace:
+            trace(
+                step=ticker,
+                frontier=len(frontier),
+                best_geodes=best_state and best_state.resources.geode,
+            )
+    metrics.nodes_expanded = expanded
+    metrics.pruned_by_bound = pruned_by_bound
+    metrics.peak_frontier = peak_frontier
+    metrics.finish()
+    if budget_expired():
+        return best_so_far(best_state, frontier)
     assert best_state is not None
     return best_state.resources.geode
 
 
+def best_so_far(best_state: FactoryState | None, frontier: SortedList) -> NonOptimal:
+    """
+    A factory that stops building and gathers for the time it has left
+    reaches an achievable geode count, so an unfinished search has an answer.
+    """
+    geodes = [state.gather(time_left).resources.geode for state, time_left in frontier]
+    if best_state is not None:
+        geodes.append(best_state.resources.geode)
+    return NonOptimal(max(geodes, default=0))
+
+
 def sort_key(state_time: tuple[FactoryState, int]) -> int:
     state, time_left = state_time
     return state.heuristic(time_left)
@@ -0,0 +1,63 @@
+import importlib
+import os
+from random import Random
+from typing import Callable
+
+from solutions.parsing import ArgsModel, build_parser
+from solutions.registry import day_module_name
+
+Generator = Callable[[int, Random], list[str]]
+
+
+def get_generator(day_number: int) -> Generator:
+    """Each day's generator lives in `solutions.generators.dayNN.generate`."""
+    module = importlib.import_module(f"{__name__}.{day_module_name(day_number)}")
+    return module.generate
+
+
+def get_default_size(day_number: int) -> int:
+    module = importlib.import_module(f"{__name__}.{day_module_name(day_number)}")
+    return module.DEFAULT_SIZE
+
+
+def generate(day_number: int, size: int, seed: int = 0) -> list[str]:
+    return get_generator(day_number)(size, Random(seed))
+
+
+def write_input(output_dir: str, day_number: int, size: int, seed: int) -> str:
+    """Named so that the directory can be used as a corpus."""
+    os.makedirs(output_dir, exist_ok=True)
+    output_filepath = os.path.join(
+        output_dir, f"{day_module_name(day_number)}-size{size}-seed{seed}.txt"
+    )
+    with open(output_filepath, "w") as f:
+        f.writelines(f"{line}\n" for line in generate(day_number, size, seed))
+    return output_filepath
+
+
+def main(argv: list[str]) -> None:
+    parser = build_parser(GenerateArgs)
+    args = parser.parse(argv)
+    size = args.size if args.size is not None else get_default_size(args.day_number)
+    for seed in range(args.seed, args.seed + args.count):
+        if args.output_dir is None:
+            for line in generate(args.day_number, size, seed):
+                print(line)
+        else:
+            print(write_input(args.output_dir, args.day_number, size, seed))
+
+
+class GenerateArgs(ArgsModel):
+    day_number: int
+    size: int | None = None
+    seed: int = 0
+    count: int = 1
+    output_dir: str | None = None
+
+    class Meta:
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {
+            "size": ("n", "size"),
+            "seed": ("s", "seed"),
+            "count": "count",
+            "output_dir": ("o", "output-dir"),
+        }
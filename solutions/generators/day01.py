@@ -0,0 +1,14 @@
+"""Size is the number of elves."""
+
+from random import Random
+
+DEFAULT_SIZE = 250
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    lines: list[str] = []
+    for elf in range(size):
+        if elf:
+            lines.append("")
+        lines.extend(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+    return lines
@@ -0,0 +1,9 @@
+"""Size is the number of rounds."""
+
+from random import Random
+
+DEFAULT_SIZE = 2500
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    return [f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size)]
@@ -0,0 +1,33 @@
+"""
+Size is the number of elf groups, i.e. a third of the number of rucksacks.
+Each rucksack in a group draws its items from letters no other rucksack in
+the group uses, so the badge is the only item all three share and each
+rucksack's shared item is the only one in both of its compartments.
+"""
+
+from random import Random
+from string import ascii_letters
+
+DEFAULT_SIZE = 100
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    lines: list[str] = []
+    for _ in range(size):
+        letters = list(ascii_letters)
+        rng.shuffle(letters)
+        badge, letters = letters[0], letters[1:]
+        for pool in (letters[0:17], letters[17:34], letters[34:51]):
+            lines.append(rucksack(pool, badge, rng))
+    return lines
+
+
+def rucksack(pool: list[str], badge: str, rng: Random) -> str:
+    shared, left_pool, right_pool = pool[0], pool[1:9], pool[9:]
+    half = rng.randint(3, 16)
+    halves = [[shared], [shared]]
+    halves[rng.randrange(2)].append(badge)
+    for items, items_pool in zip(halves, (left_pool, right_pool)):
+        items += rng.choices(items_pool, k=half - len(items))
+        rng.shuffle(items)
+    return "".join(halves[0] + halves[1])
@@ -0,0 +1,14 @@
+"""Size is the number of section assignment pairs."""
+
+from random import Random
+
+DEFAULT_SIZE = 1000
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    return [f"{section(rng)},{section(rng)}" for _ in range(size)]
+
+
+def section(rng: Random) -> str:
+    start = rng.randint(1, 99)
+    return f"{start}-{rng.randint(start, 99)}"
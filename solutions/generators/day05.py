@@ -0,0 +1,35 @@
+"""
+Size is the number of rearrangement instructions. No instruction empties a
+stack, so every stack has a crate on top at the end.
+"""
+
+from random import Random
+from string import ascii_uppercase
+
+DEFAULT_SIZE = 500
+STACK_COUNT = 9
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    stacks = [
+        rng.choices(ascii_uppercase, k=rng.randint(1, 8)) for _ in range(STACK_COUNT)
+    ]
+    height = max(map(len, stacks))
+    diagram = [
+        " ".join(
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        )
+        for level in range(height - 1, -1, -1)
+    ]
+    diagram.append(" ".join(f" {i} " for i in range(1, STACK_COUNT + 1)))
+
+    instructions: list[str] = []
+    while len(instructions) < size:
+        origin, destination = rng.sample(range(STACK_COUNT), 2)
+        if len(stacks[origin]) < 2:
+            continue
+        number = rng.randint(1, len(stacks[origin]) - 1)
+        stacks[destination].extend(stacks[origin][-number:])
+        del stacks[origin][-number:]
+        instructions.append(f"move {number} from {origin + 1} to {destination + 1}")
+    return diagram + [""] + instructions
@@ -0,0 +1,18 @@
+"""
+Size is the length of the datastream. Only three letters are used until the
+14 all-different characters that end ten characters from the end; they start
+with the letter before them, so neither marker can complete any earlier.
+"""
+
+from random import Random
+from string import ascii_lowercase
+
+DEFAULT_SIZE = 4000
+TAIL = 10
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    prefix = rng.choices("abc", k=max(size - 14 - TAIL, 1))
+    letters = ascii_lowercase.replace(prefix[-1], "")
+    marker = [prefix[-1]] + rng.sample(letters, 13)
+    return ["".join(prefix + marker + rng.choices(ascii_lowercase, k=TAIL))]
@@ -0,0 +1,33 @@
+"""
+Size is the number of directories. Files are small enough that the whole
+filesystem fits in the space the update needs, so any directory can be deleted.
+"""
+
+from random import Random
+
+DEFAULT_SIZE = 200
+TOTAL_SPACE = 40_000_000
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    children: list[list[int]] = [[] for _ in range(size + 1)]
+    for directory in range(1, size + 1):
+        children[rng.randrange(directory)].append(directory)
+    files = [rng.randint(0, 8) for _ in range(size + 1)]
+    max_file_size = max(min(TOTAL_SPACE // max(sum(files), 1), 100_000), 1)
+
+    lines = ["$ cd /"]
+
+    def walk(directory: int) -> None:
+        lines.append("$ ls")
+        for child in children[directory]:
+            lines.append(f"dir d{child}")
+        for index in range(files[directory]):
+            lines.append(f"{rng.randint(1, max_file_size)} f{index}.txt")
+        for child in children[directory]:
+            lines.append(f"$ cd d{child}")
+            walk(child)
+            lines.append("$ cd ..")
+
+    walk(0)
+    return lines
@@ -0,0 +1,9 @@
+"""Size is the width and height of the square tree grid."""
+
+from random import Random
+
+DEFAULT_SIZE = 100
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    return ["".join(rng.choices("0123456789", k=size)) for _ in range(size)]
@@ -0,0 +1,9 @@
+"""Size is the number of head motions."""
+
+from random import Random
+
+DEFAULT_SIZE = 2000
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    return [f"{rng.choice('RLUD')} {rng.randint(1, 20)}" for _ in range(size)]
@@ -0,0 +1,19 @@
+"""Size is the number of instructions, at least enough to reach cycle 220."""
+
+from random import Random
+
+DEFAULT_SIZE = 150
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    """X stays within the 40 pixel wide screen, so the sprite is drawn."""
+    x = 1
+    lines: list[str] = []
+    for _ in range(max(size, 220)):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            value = rng.randint(-x, 39 - x) or 1
+            x += value
+            lines.append(f"addx {value}")
+    return lines
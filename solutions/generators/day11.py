@@ -0,0 +1,43 @@
+"""
+Size is the number of monkeys, at least two. With three or more, monkey 0
+squares its worry levels, and nobody throws to it: repeated squaring in the
+unreduced first part would grow the numbers without bound.
+"""
+
+from random import Random
+
+DEFAULT_SIZE = 8
+PRIMES = [
+    p
+    for p in range(2, 1000)
+    if all(p % divisor for divisor in range(2, int(p**0.5) + 1))
+]
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    size = max(size, 2)
+    divisors = rng.sample(PRIMES[: max(size, 10)], size)
+    lines: list[str] = []
+    for index, divisor in enumerate(divisors):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        squares = size > 2
+        if squares and index == 0:
+            operation = "old * old"
+        else:
+            operation = rng.choice(
+                [f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 9)}"]
+            )
+        true_target, false_target = rng.choices(
+            [other for other in range(squares, size) if other != index], k=2
+        )
+        if index:
+            lines.append("")
+        lines += [
+            f"Monkey {index}:",
+            f"  Starting items: {items}",
+            f"  Operation: new = {operation}",
+            f"  Test: divisible by {divisor}",
+            f"    If true: throw to monkey {true_target}",
+            f"    If false: throw to monkey {false_target}",
+        ]
+    return lines
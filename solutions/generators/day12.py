@@ -0,0 +1,29 @@
+"""
+Size is the width and height of the square heightmap, at least 26. Height
+never falls moving right or down and never rises by more than one per step,
+so the best signal spot in the far corner is always reachable.
+"""
+
+from random import Random
+from string import ascii_lowercase
+
+DEFAULT_SIZE = 100
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    size = max(size, 26)
+    steps = set(rng.sample(range(2 * (size - 1)), 25))
+    column_heights = [sum(step < x for step in steps) for x in range(size)]
+    row_heights = [
+        sum(size - 1 <= step < size - 1 + y for step in steps) for y in range(size)
+    ]
+    rows = [
+        [
+            ascii_lowercase[row_height + column_height]
+            for column_height in column_heights
+        ]
+        for row_height in row_heights
+    ]
+    rows[0][0] = "S"
+    rows[-1][-1] = "E"
+    return ["".join(row) for row in rows]
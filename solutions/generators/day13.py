@@ -0,0 +1,26 @@
+"""Size is the number of packet pairs."""
+
+from random import Random
+
+DEFAULT_SIZE = 150
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    lines: list[str] = []
+    for index in range(size):
+        if index:
+            lines.append("")
+        lines += [packet(rng, 4), packet(rng, 4)]
+    return lines
+
+
+def packet(rng: Random, depth: int) -> str:
+    items = [
+        (
+            packet(rng, depth - 1)
+            if depth and rng.random() < 0.3
+            else str(rng.randint(0, 10))
+        )
+        for _ in range(rng.randint(0, 5))
+    ]
+    return f"[{','.join(items)}]"
@@ -0,0 +1,38 @@
+"""
+Size is the number of rock paths; the cave widens and deepens with it. Rock
+only sits deeper below the sand source than it spreads to either side, so the
+sand pile can never be caught and block the source before sand falls into the
+abyss.
+"""
+
+from random import Random
+
+DEFAULT_SIZE = 150
+SOURCE_X = 500
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    half_width = 5 + size // 2
+    top, bottom = half_width + 1, half_width + 10 + size
+    lines: list[str] = []
+    for _ in range(size):
+        x = rng.randint(SOURCE_X - half_width, SOURCE_X + half_width)
+        y = rng.randint(top, bottom)
+        points = [(x, y)]
+        for segment in range(rng.randint(1, 5)):
+            while (x, y) == points[-1]:
+                if segment % 2:
+                    y = clamp(y + rng.randint(-6, 6), top, bottom)
+                else:
+                    x = clamp(
+                        x + rng.randint(-6, 6),
+                        SOURCE_X - half_width,
+                        SOURCE_X + half_width,
+                    )
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return lines
+
+
+def clamp(value: int, low: int, high: int) -> int:
+    return max(low, min(value, high))
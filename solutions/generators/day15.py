@@ -0,0 +1,36 @@
+"""
+Size is the number of sensors, at least four. Four large sensors surround a
+hidden distress beacon position from each diagonal, leaving it the only
+uncovered point in the search area; the rest are small sensors placed so as
+not to reach it.
+"""
+
+from random import Random
+
+DEFAULT_SIZE = 30
+SEARCH_LIMIT = 4_000_000
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    hx = rng.randint(2 * SEARCH_LIMIT // 5, 3 * SEARCH_LIMIT // 5)
+    hy = rng.randint(2 * SEARCH_LIMIT // 5, 3 * SEARCH_LIMIT // 5)
+    reach = max(hx, hy, SEARCH_LIMIT - hx, SEARCH_LIMIT - hy) + 1
+    sensors = [
+        ((hx + dx * reach, hy + dy * reach), 2 * reach - 1)
+        for dx, dy in ((-1, -1), (1, 1), (-1, 1), (1, -1))
+    ]
+    while len(sensors) < size:
+        sensor = (rng.randint(0, SEARCH_LIMIT), rng.randint(0, SEARCH_LIMIT))
+        distance = abs(sensor[0] - hx) + abs(sensor[1] - hy)
+        if distance > 1:
+            sensors.append((sensor, rng.randint(1, min(distance - 1, 500_000))))
+    rng.shuffle(sensors)
+
+    lines: list[str] = []
+    for (sx, sy), radius in sensors:
+        dx = rng.randint(-radius, radius)
+        dy = rng.choice((-1, 1)) * (radius - abs(dx))
+        lines.append(
+            f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx + dx}, y={sy + dy}"
+        )
+    return lines
@@ -0,0 +1,46 @@
+"""
+Size is the number of valves, between ten and 676. Valves form a connected
+network starting from AA with no dead ends, and about a third of them (at
+least five) have a flow rate. The solver never waits or walks back the way it
+came without opening a valve, so it needs somewhere to go for all 30 minutes.
+"""
+
+from itertools import product
+from random import Random
+from string import ascii_uppercase
+
+DEFAULT_SIZE = 15
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    names = ["".join(pair) for pair in product(ascii_uppercase, repeat=2)]
+    names.remove("AA")
+    rng.shuffle(names)
+    names = ["AA"] + names[: max(size, 10) - 1]
+
+    tunnels: dict[str, set[str]] = {name: set() for name in names}
+    for index, name in enumerate(names[1:], 1):
+        other = names[rng.randrange(index)]
+        tunnels[name].add(other)
+        tunnels[other].add(name)
+    for name in names:
+        while len(tunnels[name]) < 3:
+            other = rng.choice(names)
+            if other != name:
+                tunnels[name].add(other)
+                tunnels[other].add(name)
+
+    rates = {name: rng.randint(1, 25) if rng.random() < 0.35 else 0 for name in names}
+    rates["AA"] = 0
+    for name in names[1:6]:
+        rates[name] = rates[name] or rng.randint(1, 25)
+
+    lines: list[str] = []
+    for name in names:
+        connections = sorted(tunnels[name])
+        plural = "s lead to valves" if len(connections) > 1 else " leads to valve"
+        lines.append(
+            f"Valve {name} has flow rate={rates[name]}; "
+            f"tunnel{plural} {', '.join(connections)}"
+        )
+    return lines
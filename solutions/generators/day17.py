@@ -0,0 +1,9 @@
+"""Size is the length of the jet pattern."""
+
+from random import Random
+
+DEFAULT_SIZE = 10_000
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    return ["".join(rng.choices("<>", k=max(size, 1)))]
@@ -0,0 +1,13 @@
+"""Size is the number of cubes, packed into a box that grows to fit them."""
+
+from random import Random
+
+DEFAULT_SIZE = 2500
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    side = max(round((size * 3) ** (1 / 3)), 2)
+    cubes: set[tuple[int, int, int]] = set()
+    while len(cubes) < min(size, side**3):
+        cubes.add((rng.randrange(side), rng.randrange(side), rng.randrange(side)))
+    return [f"{x},{y},{z}" for x, y, z in cubes]
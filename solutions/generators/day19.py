@@ -0,0 +1,18 @@
+"""Size is the number of blueprints."""
+
+from random import Random
+
+DEFAULT_SIZE = 30
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    return [
+        f"Blueprint {number}: "
+        f"Each ore robot costs {rng.randint(2, 4)} ore. "
+        f"Each clay robot costs {rng.randint(2, 4)} ore. "
+        f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+        f"and {rng.randint(5, 20)} clay. "
+        f"Each geode robot costs {rng.randint(2, 4)} ore "
+        f"and {rng.randint(5, 20)} obsidian."
+        for number in range(1, size + 1)
+    ]
@@ -0,0 +1,11 @@
+"""Size is the number of values in the file, exactly one of which is 0."""
+
+from random import Random
+
+DEFAULT_SIZE = 5000
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10_000) for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return list(map(str, numbers))
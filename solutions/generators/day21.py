@@ -0,0 +1,75 @@
+"""
+Size is the depth of the monkey tree, i.e. the number of monkeys between root
+and humn. Every division is exact, both when the tree is evaluated and when it
+is balanced for humn, and every yelled number is non-negative.
+"""
+
+from itertools import product
+from random import Random
+from string import ascii_lowercase
+
+DEFAULT_SIZE = 60
+MAX_VALUE = 10**12
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    names = iter(
+        rng.sample(
+            [
+                name
+                for name in map("".join, product(ascii_lowercase, repeat=4))
+                if name not in ("root", "humn")
+            ],
+            12 * size + 40,
+        )
+    )
+    lines: list[str] = []
+
+    def monkey(job: str) -> str:
+        name = next(names)
+        lines.append(f"{name}: {job}")
+        return name
+
+    def yelling(value: int, depth: int) -> str:
+        """A monkey whose value is exactly `value`."""
+        if depth == 0:
+            return monkey(str(value))
+        other = rng.randint(1, 20)
+        match rng.choice("+-*/"):
+            case "*" if value % 2 == 0 and value != 0:
+                return monkey(f"{yelling(value // 2, depth - 1)} * {monkey('2')}")
+            case "/":
+                left = yelling(value * other, depth - 1)
+                return monkey(f"{left} / {monkey(str(other))}")
+            case "+" if value >= other:
+                return monkey(
+                    f"{yelling(value - other, depth - 1)} + {monkey(str(other))}"
+                )
+            case _:
+                return monkey(
+                    f"{yelling(value + other, depth - 1)} - {monkey(str(other))}"
+                )
+
+    humn_value = rng.randint(1, 1000)
+    lines.append(f"humn: {humn_value}")
+    name, value = "humn", humn_value
+    for _ in range(size):
+        other_value = rng.randint(1, 20)
+        humn_left = rng.random() < 0.5
+        difference = value - other_value if humn_left else other_value - value
+        match rng.choice("+-*/"):
+            case "*" if abs(value * other_value) < MAX_VALUE:
+                op, value = "*", value * other_value
+            case "/" if humn_left and value % other_value == 0:
+                op, value = "/", value // other_value
+            case "-" if difference >= 0:
+                op, value = "-", difference
+            case _:
+                op, value = "+", value + other_value
+        other = yelling(other_value, rng.randint(0, 2))
+        left, right = (name, other) if humn_left else (other, name)
+        name = monkey(f"{left} {op} {right}")
+    left, right = rng.sample([name, yelling(value, rng.randint(0, 4))], 2)
+    lines.append(f"root: {left} + {right}")
+    rng.shuffle(lines)
+    return lines
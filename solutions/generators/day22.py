@@ -0,0 +1,21 @@
+"""
+Size is the width and height of the square board, which is also the number of
+moves in the path.
+"""
+
+from random import Random
+
+DEFAULT_SIZE = 150
+
+
+def generate(size: int, rng: Random) -> list[str]:
+    size = max(size, 2)
+    rows = [
+        "".join("#" if rng.random() < 0.1 else "." for _ in range(size))
+        for _ in range(size)
+    ]
+    rows[0] = "." + rows[0][1:]
+    path = "".join(
+        f"{rng.randint(1, size)}{rng.choice('LR')}" for _ in range(size - 1)
+    ) + str(rng.randint(1, size))
+    return rows + ["", path]
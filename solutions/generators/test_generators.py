@@ -0,0 +1,103 @@
+import os
+import re
+
+import pytest
+
+from solutions.registry import solution_functions
+
+from . import generate, main
+
+# Small enough to solve quickly. Days 15, 16, 17 and 19 are pinned to seeds the
+# solvers are quick on: day 15 scans millions of columns on any valid input,
+# days 16 and 19 are searches whose time varies a lot from input to input,
+# and day 17's cycle detection only finishes when the pile repeats every
+# `len(jets) * 5` ticks.
+SMOKE_CASES: dict[int, tuple[int, int]] = {
+    **{day_number: (30, 0) for day_number in range(1, 23)},
+    11: (8, 0),
+    12: (30, 0),
+    15: (4, 1),
+    16: (10, 3),
+    17: (30, 1),
+    19: (1, 8),
+}
+
+
+@pytest.mark.parametrize("day_number", sorted(SMOKE_CASES))
+def test_solves(day_number: int) -> None:
+    size, seed = SMOKE_CASES[day_number]
+    inputs = generate(day_number, size, seed)
+    assert inputs == generate(day_number, size, seed)
+    part1, part2 = solution_functions[day_number][0](inputs, False)
+    assert part1 is not None and part2 is not None
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_day06_markers_at_end(seed: int) -> None:
+    (stream,) = generate(6, 500, seed)
+    assert solution_functions[6][0]([stream], False) == (480, 490)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_day12_shortest_path(seed: int) -> None:
+    part1, _ = solution_functions[12][0](generate(12, 40, seed), False)
+    assert part1 == 2 * (40 - 1)
+
+
+def test_day15_single_gap() -> None:
+    size, seed = SMOKE_CASES[15]
+    inputs = generate(15, size, seed)
+    _, part2 = solution_functions[15][0](inputs, False)
+    x, y = divmod(part2, 4_000_000)
+    for line in inputs:
+        sx, sy, bx, by = map(int, re.findall(r"-?\d+", line))
+        assert abs(sx - x) + abs(sy - y) > abs(sx - bx) + abs(sy - by)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_day21_balances_to_humn(seed: int) -> None:
+    inputs = generate(21, 40, seed)
+    (humn,) = [line for line in inputs if line.startswith("humn: ")]
+    _, part2 = solution_functions[21][0](inputs, False)
+    assert part2 == int(humn.removeprefix("humn: "))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_day21_yells_are_non_negative(seed: int) -> None:
+    jobs = dict(line.split(": ") for line in generate(21, 40, seed))
+    values: dict[str, int] = {}
+
+    def value(name: str) -> int:
+        if name not in values:
+            match jobs[name].split(" "):
+                case [number]:
+                    values[name] = int(number)
+                case [left, "+", right]:
+                    values[name] = value(left) + value(right)
+                case [left, "-", right]:
+                    values[name] = value(left) - value(right)
+                case [left, "*", right]:
+                    values[name] = value(left) * value(right)
+                case [left, "/", right]:
+                    assert value(left) % value(right) == 0
+                    values[name] = value(left) // value(right)
+        return values[name]
+
+    value("root")
+    assert min(values.values()) >= 0
+
+
+def test_main_writes_files(tmp_path: str, capsys: pytest.CaptureFixture) -> None:
+    main(["20", "-n", "50", "-s", "3", "--count", "2", "-o", str(tmp_path)])
+    filenames = sorted(os.listdir(tmp_path))
+    assert filenames == ["day20-size50-seed3.txt", "day20-size50-seed4.txt"]
+    with open(os.path.join(tmp_path, filenames[0])) as f:
+        assert f.read().splitlines() == generate(20, 50, 3)
+    assert capsys.readouterr().out.split() == [
+        os.path.join(tmp_path, filename) for filename in filenames
+    ]
+
+
+def test_main_stdout(capsys: pytest.CaptureFixture) -> None:
+    main(["2", "--size", "5"])
+    assert capsys.readouterr().out.splitlines() == generate(2, 5, 0)
@@ -0,0 +1,208 @@
+import io
+import mmap
+import os
+import re
+import stat
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from itertools import pairwise
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    TypeVar,
+    overload,
+)
+
+CORPUS_FILE_RE = r"(?:day|test)(?P<day_number>\d\d)"
+
+InputKind = Literal["list", "lines", "bytes", "packed"]
+S = TypeVar("S", bound=Callable[..., Any])
+
+
+def input_kind(kind: InputKind) -> Callable[[S], S]:
+    """
+    Solvers get a `list[str]` by default. A solver that only makes one pass
+    over its lines can take "lines", a lazy iterator of lines read from an
+    mmap, and one that parses bytes itself can take "bytes", a memoryview of
+    the whole file. A solver that indexes or slices its lines can take
+    "packed", a `PackedLines` that stores them all in one buffer. Whatever
+    the kind, the solver should still accept a list.
+    """
+
+    def mark(solver: S) -> S:
+        setattr(solver, "input_kind", kind)
+        return solver
+
+    return mark
+
+
+def get_input_kind(solver: Callable[..., Any]) -> InputKind:
+    return getattr(solver, "input_kind", "list")
+
+
+@contextmanager
+def solver_input(
+    solver: Callable[..., Any], input_filepath: str
+) -> Iterator[list[str] | Iterable[str] | memoryview]:
+    match get_input_kind(solver):
+        case "lines":
+            with open_mapped(input_filepath) as mapped:
+                yield iter_lines(mapped)
+        case "bytes":
+            with open_mapped(input_filepath) as mapped:
+                with memoryview(
+                    mapped if isinstance(mapped, mmap.mmap) else mapped.read()
+                ) as buffer:
+                    yield buffer
+        case "packed":
+            yield PackedLines.from_file(input_filepath)
+        case _:
+            yield read_input(input_filepath)
+
+
+def read_input(input_filepath: str) -> list[str]:
+    with open(input_filepath) as f:
+        return [line.replace("\n", "") for line in f.readlines()]
+
+
+class PackedLines(Sequence[str]):
+    """
+    Lines kept as one bytes buffer and an array of where each line starts,
+    about 4 bytes of overhead per line instead of a str object's 50 or so.
+    A line is only decoded when it's read. Slices share the buffer.
+
+    The buffer always ends in a newline, and CRLF endings are normalized
+    when it's built, so line `i` runs from `offsets[i]` up to the newline
+    just before `offsets[i + 1]`.
+    """
+
+    buffer: bytes
+    offsets: array
+
+    def __init__(self, buffer: bytes, offsets: array) -> None:
+        self.buffer = buffer
+        self.offsets = offsets
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PackedLines":
+        if b"\r" in data:
+            data = data.replace(b"\r\n", b"\n")
+        if data and not data.endswith(b"\n"):
+            data += b"\n"
+        offsets = array("I" if len(data) < 2**32 else "Q", [0])
+        find = data.find
+        position = find(b"\n")
+        while position != -1:
+            offsets.append(position + 1)
+            position = find(b"\n", position + 1)
+        return cls(data, offsets)
+
+    @classmethod
+    def from_file(cls, input_filepath: str) -> "PackedLines":
+        with open(input_filepath, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PackedLines | list[str]": ...
+
+    def __getitem__(self, index: int | slice) -> "str | PackedLines | list[str]":
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return PackedLines(self.buffer, self.offsets[start : max(start, stop) + 1])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return self.buffer[self.offsets[index] : self.offsets[index + 1] - 1].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        buffer = self.buffer
+        for start, end in pairwise(self.offsets):
+            yield buffer[start : end - 1].decode()
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """
+        Searches the buffer rather than decoding every line, e.g. for the
+        blank line `index("")` that splits day 5's input.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        needle = f"{value}\n".encode()
+        position = self.offsets[start]
+        end = self.offsets[stop]
+        while True:
+            position = self.buffer.find(needle, position, end)
+            if position == -1:
+                raise ValueError(f"{value!r} is not in lines")
+            line = bisect_left(self.offsets, position)
+            if self.offsets[line] == position:
+                return line
+            position += 1
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.itemsize * len(self.offsets)
+
+
+def split_lines(text: str) -> list[str]:
+    """Splits input text the same way `read_input` splits a file."""
+    lines = text.replace("\r\n", "\n").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+@contextmanager
+def open_mapped(
+    input_filepath: str,
+) -> Iterator[mmap.mmap | io.BytesIO | BinaryIO]:
+    """
+    The file mapped read-only into memory rather than read into a copy.
+    Empty files can't be mapped, so they get an empty buffer instead. Nor
+    can pipes, which are read as they arrive.
+    """
+    with open(input_filepath, "rb") as f:
+        status = os.fstat(f.fileno())
+        if not stat.S_ISREG(status.st_mode):
+            yield f
+        elif status.st_size == 0:
+            yield io.BytesIO()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+
+def iter_lines(mapped: mmap.mmap | io.BytesIO | BinaryIO) -> Iterator[str]:
+    """Lines without their line endings, like `read_input` but one at a time."""
+    for line in iter(mapped.readline, b""):
+        yield line.removesuffix(b"\n").removesuffix(b"\r").decode()
+
+
+def corpus_inputs(corpus_dir: str) -> dict[int, list[str]]:
+    """
+    Files in a corpus are matched to days by name, e.g. `day05.txt` or
+    `test05-large.txt` are inputs for day 5.
+    """
+    inputs: dict[int, list[str]] = {}
+    for dirpath, _, filenames in os.walk(corpus_dir):
+        for filename in sorted(filenames):
+            match = re.match(CORPUS_FILE_RE, filename)
+            if match is not None:
+                day_number = int(match.group("day_number"))
+                inputs.setdefault(day_number, []).append(
+                    os.path.join(dirpath, filename)
+                )
+    return {day_number: inputs[day_number] for day_number in sorted(inputs)}
@@ -0,0 +1,60 @@
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Iterator
+
+_collected: ContextVar[list["SearchMetrics"] | None] = ContextVar(
+    "collected", default=None
+)
+
+
+@dataclass
+class SearchMetrics:
+    """
+    What a branch and bound search did. A node is expanded when its children
+    are generated. A node is pruned by bound when its upper bound can't beat
+    the incumbent, the best complete answer found so far, and by dominance
+    when another node with the same state is at least as good. Nodes left
+    on the frontier when the bound ends the search count as pruned by bound.
+    """
+
+    search: str
+    nodes_expanded: int = 0
+    pruned_by_bound: int = 0
+    pruned_by_dominance: int = 0
+    peak_frontier: int = 0
+    first_incumbent_ns: int | None = None
+    elapsed_ns: int = 0
+    started_ns: int = field(default_factory=time.perf_counter_ns, repr=False)
+
+    def found_incumbent(self) -> None:
+        if self.first_incumbent_ns is None:
+            self.first_incumbent_ns = time.perf_counter_ns() - self.started_ns
+
+    def finish(self) -> None:
+        """Called once when the search ends; collects the metrics if asked to."""
+        self.elapsed_ns = time.perf_counter_ns() - self.started_ns
+        collected = _collected.get()
+        if collected is not None:
+            collected.append(self)
+
+    def to_json(self) -> str:
+        fields = asdict(self)
+        del fields["started_ns"]
+        return json.dumps(fields)
+
+
+@contextmanager
+def collect_metrics(enabled: bool = True) -> Iterator[list[SearchMetrics]]:
+    """Every search that finishes in here adds its metrics to the list."""
+    if not enabled:
+        yield []
+        return
+    collected: list[SearchMetrics] = []
+    token = _collected.set(collected)
+    try:
+        yield collected
+    finally:
+        _collected.reset(token)
@@ -29,44 +29,6 @@ def main(*args: str):
     with open(test_filepath, "w") as tf:
         tf.write(test_file_contents)
 
-    main_fp = f"{dir}/__main__.py"
-    with open(main_fp) as m:
-        main_contents = m.readlines()
-
-    im_ix = next(
-        index
-        for index, line in enumerate(main_contents)
-        if line.startswith("from solutions import")
-    )
-    if main_contents[im_ix].strip().endswith("("):
-        im_end_ix = next(
-            index
-            for index, line in enumerate(main_contents[im_ix:], start=im_ix)
-            if line.startswith(")")
-        )
-        solution_imports = main_contents[im_ix + 1 : im_end_ix]
-        solution_imports.append(f"    day{day_name},\n")
-        solution_imports.sort()
-        main_contents[im_ix + 1 : im_end_ix] = solution_imports
-    else:
-        main_contents[im_ix] = main_contents[im_ix][:-1] + f", day{day_name}\n"
-
-    sf_ix = next(
-        index
-        for index, line in enumerate(main_contents)
-        if line.startswith("solution_functions: ")
-    )
-    sf_end_ix = next(
-        index
-        for index, line in enumerate(main_contents[sf_ix:], start=sf_ix)
-        if line.startswith("}")
-    )
-    main_contents[
-        sf_end_ix:sf_end_ix
-    ] = f"    {int(day_name)}: [day{day_name}.alpha],\n"
-    with open(main_fp, "w") as m:
-        m.writelines(main_contents)
-
     print("Run solution:")
     print(f"    python -m solutions {day_name} <input_file>")
     print(
@@ -0,0 +1,184 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, replace
+from typing import Any
+
+from solutions.inputs import corpus_inputs, read_input
+from solutions.parsing import ArgsModel, build_parser
+from solutions.registry import solution_functions
+from solutions.timing import format_ns, measure, quiet, time_call
+
+GO_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "go")
+GO_DAYS = (1, 2, 3, 8, 12, 16)
+UNIMPLEMENTED_DAY = 25
+
+
+@dataclass(frozen=True)
+class ParityResult:
+    day_number: int
+    input_filepath: str
+    size_bytes: int
+    python_answer: str
+    go_answer: str
+    python_ns: int
+    go_ns: int
+
+    @property
+    def matches(self) -> bool:
+        return self.python_answer == self.go_answer
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "day": self.day_number,
+                "file": self.input_filepath,
+                "bytes": self.size_bytes,
+                "python_answer": self.python_answer,
+                "go_answer": self.go_answer,
+                "matches": self.matches,
+                "python_ms": self.python_ns / 1_000_000,
+                "go_ms": self.go_ns / 1_000_000,
+            }
+        )
+
+
+def main(argv: list[str]) -> None:
+    parser = build_parser(ParityArgs)
+    args = parser.parse(argv)
+    if shutil.which("go") is None:
+        sys.exit("The go toolchain isn't on PATH, so the Go ports can't be built.")
+    day_numbers = GO_DAYS if args.day_number is None else (args.day_number,)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        binary = build_go(temp_dir)
+        if args.corpus is not None:
+            corpus = corpus_inputs(args.corpus)
+            inputs = [
+                (day, input_filepath)
+                for day in day_numbers
+                for input_filepath in corpus.get(day, [])
+            ]
+        else:
+            from solutions.generators import get_default_size, write_input
+
+            inputs = [
+                (
+                    day,
+                    write_input(
+                        temp_dir, day, args.size or get_default_size(day), args.seed
+                    ),
+                )
+                for day in day_numbers
+            ]
+        startup_ns = go_startup_ns(binary, inputs[0][1], args.repeats) if inputs else 0
+        results: list[ParityResult] = []
+        for day_number, input_filepath in inputs:
+            result = compare(
+                binary, day_number, args.version, input_filepath, args.repeats
+            )
+            result = replace(result, go_ns=max(result.go_ns - startup_ns, 0))
+            results.append(result)
+            if args.json:
+                print(result.to_json(), flush=True)
+    if not args.json:
+        print(f"Go process startup of {format_ns(startup_ns)} subtracted")
+        for line in format_table(results):
+            print(line)
+    if not all(result.matches for result in results):
+        sys.exit(1)
+
+
+class ParityArgs(ArgsModel):
+    corpus: str | None = None
+    day_number: int | None = None
+    version: int = 0
+    size: int | None = None
+    seed: int = 0
+    repeats: int = 3
+    json: bool
+
+    class Meta:
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {
+            "corpus": "corpus",
+            "day_number": ("d", "day"),
+            "version": ("v", "version"),
+            "size": ("n", "size"),
+            "seed": ("s", "seed"),
+            "repeats": ("r", "repeats"),
+        }
+
+
+def build_go(output_dir: str) -> str:
+    binary = os.path.join(output_dir, "aoc-go")
+    subprocess.run(["go", "build", "-o", binary, "."], cwd=GO_DIR, check=True)
+    return binary
+
+
+def run_go(binary: str, day_number: int, input_filepath: str) -> tuple[str, int]:
+    """The Go binary prints its answer on the last line, e.g. `24000 45000`."""
+    command = [binary, "-day", str(day_number), "-input", input_filepath]
+    completed, elapsed_ns = time_call(
+        lambda: subprocess.run(command, capture_output=True, text=True, check=True)
+    )
+    lines = completed.stdout.strip().splitlines()
+    return (lines[-1] if lines else ""), elapsed_ns
+
+
+def go_startup_ns(binary: str, input_filepath: str, repeats: int) -> int:
+    """
+    Each Go run is a fresh process. What it costs to start one and read the
+    input is measured on a day the binary doesn't implement, so that it can
+    be subtracted from the solve times.
+    """
+    return min(
+        run_go(binary, UNIMPLEMENTED_DAY, input_filepath)[1] for _ in range(repeats)
+    )
+
+
+def compare(
+    binary: str, day_number: int, version: int, input_filepath: str, repeats: int
+) -> ParityResult:
+    """Each side's fastest of `repeats` runs, Python in-process after a warmup."""
+    solver = solution_functions[day_number][version]
+    input_strs = read_input(input_filepath)
+    with quiet():
+        python_answer, python_stats = measure(
+            lambda: solver(list(input_strs), False), warmups=1, repeats=repeats
+        )
+    go_runs = [run_go(binary, day_number, input_filepath) for _ in range(repeats)]
+    return ParityResult(
+        day_number=day_number,
+        input_filepath=input_filepath,
+        size_bytes=os.path.getsize(input_filepath),
+        python_answer=format_answer(python_answer),
+        go_answer=go_runs[-1][0],
+        python_ns=python_stats.min_ns,
+        go_ns=min(elapsed_ns for _, elapsed_ns in go_runs),
+    )
+
+
+def format_answer(answer: Any) -> str:
+    """A Python answer the way Go's `fmt.Println` prints the same values."""
+    if isinstance(answer, tuple):
+        return " ".join(map(str, answer))
+    return str(answer)
+
+
+def format_table(results: list[ParityResult]) -> list[str]:
+    lines = [f"{'day':>3} {'python':>14} {'go':>14} {'python/go':>10}  answers  file"]
+    for result in results:
+        ratio = result.python_ns / (result.go_ns or 1)
+        answers = (
+            "match"
+            if result.matches
+            else f"python {result.python_answer!r} != go {result.go_answer!r}"
+        )
+        lines.append(
+            f"{result.day_number:>3} {format_ns(result.python_ns):>14} "
+            f"{format_ns(result.go_ns):>14} {ratio:>9.1f}x  {answers}  "
+            f"{os.path.basename(result.input_filepath)}"
+        )
+    return lines
@@ -1,12 +1,76 @@
+import types
 from argparse import ArgumentParser
-from typing import Generic, Iterable, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Iterable,
+    NamedTuple,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
-from pydantic import BaseModel
 
+class ArgField(NamedTuple):
+    type_: type
+    default: Any
+    required: bool
+
+
+class ArgsModel:
+    """
+    Arguments declared as annotated class attributes, like a pydantic model.
+    Every run of `python -m solutions` builds one, so this is kept to the
+    standard library: importing pydantic alone took longer than many solves.
+    A `bool` field is an off-by-default flag; `X | None` fields are optional.
+    """
+
+    __fields__: ClassVar[dict[str, ArgField]] = {}
 
-class ArgsModel(BaseModel):
     class Meta:
-        flags: dict[str, tuple[str, str] | tuple[str] | str]
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__fields__ = {
+            name: build_field(annotation, cls.__dict__.get(name, ...))
+            for name, annotation in cls.__dict__.get("__annotations__", {}).items()
+        }
+
+    def __init__(self, **values: Any) -> None:
+        unknown = set(values).difference(self.__fields__)
+        if unknown:
+            raise TypeError(f"Unknown arguments: {', '.join(sorted(unknown))}")
+        for name, field in self.__fields__.items():
+            if name in values:
+                setattr(self, name, values[name])
+            elif field.required:
+                raise TypeError(f"Missing argument: {name}")
+            else:
+                setattr(self, name, field.default)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__fields__
+        )
+        return f"{self.__class__.__name__}({values})"
+
+
+def build_field(annotation: Any, default: Any) -> ArgField:
+    type_ = annotation
+    optional = False
+    if get_origin(annotation) in (Union, types.UnionType):
+        type_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        optional = len(type_args) < len(get_args(annotation))
+        (type_,) = type_args
+    if default is ...:
+        if type_ is bool:
+            default = False
+        elif optional:
+            default = None
+    return ArgField(type_=type_, default=default, required=default is ...)
 
 
 M_ = TypeVar("M_", bound=ArgsModel)
@@ -41,7 +105,17 @@ def build_parser(model: type[M_]) -> Parser[M_]:
         else:
             argnames = (field_name,)
         if field.type_ is bool:
-            arg_parser.add_argument(f"--{field_name}", action="store_true")
+            if flags is None:
+                argnames = (f"--{field_name}",)
+            arg_parser.add_argument(*argnames, dest=field_name, action="store_true")
+        elif flags is not None:
+            arg_parser.add_argument(
+                *argnames, dest=field_name, type=field.type_, default=field.default
+            )
+        elif not field.required:
+            arg_parser.add_argument(
+                *argnames, type=field.type_, default=field.default, nargs="?"
+            )
         else:
             arg_parser.add_argument(*argnames, type=field.type_, default=field.default)
 
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from solutions.timing import time_call
+
+S = TypeVar("S", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class Stages:
+    parse: Callable[[list[str]], Any]
+    part1: Callable[[Any], Any]
+    part2: Callable[[Any], Any]
+
+
+def staged(
+    parse: Callable[[list[str]], Any],
+    part1: Callable[[Any], Any],
+    part2: Callable[[Any], Any],
+) -> Callable[[S], S]:
+    """
+    A solver whose parts can be run on their own, both from one parse. The
+    solver itself still solves both parts; the stages are for when only one
+    of them is wanted, or each is to be timed separately.
+    """
+
+    def mark(solver: S) -> S:
+        setattr(solver, "stages", Stages(parse, part1, part2))
+        return solver
+
+    return mark
+
+
+def get_stages(solver: Callable[..., Any]) -> Stages | None:
+    return getattr(solver, "stages", None)
+
+
+def solve_parts(
+    solver: Callable[..., Any], inputs: list[str], parts: tuple[int, ...]
+) -> tuple[dict[int, Any], list[tuple[str, int]]]:
+    """
+    The answers to the parts asked for, and how long each stage took. A
+    solver without stages can't skip a part, so it's run whole and timed as
+    one "solve" stage.
+    """
+    stages = get_stages(solver)
+    if stages is None:
+        answer, elapsed_ns = time_call(lambda: solver(inputs, False))
+        return {part: answer[part - 1] for part in parts}, [("solve", elapsed_ns)]
+    parsed, parse_ns = time_call(lambda: stages.parse(inputs))
+    answers: dict[int, Any] = {}
+    timings = [("parse", parse_ns)]
+    for part in parts:
+        run_part = stages.part1 if part == 1 else stages.part2
+        answers[part], elapsed_ns = time_call(lambda: run_part(parsed))
+        timings.append((f"part {part}", elapsed_ns))
+    return answers, timings
+
+
+def parse_parts(parts_spec: str) -> tuple[int, ...]:
+    """`1`, `2` or `1,2`."""
+    parts = tuple(sorted({int(part) for part in parts_spec.split(",")}))
+    if not parts or not set(parts) <= {1, 2}:
+        raise ValueError(f"Parts must be 1, 2 or 1,2, not {parts_spec!r}")
+    return parts
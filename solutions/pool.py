@@ -0,0 +1,173 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Callable, Iterator
+
+from solutions.budget import time_budget
+from solutions.cache import solve_cached
+from solutions.inputs import corpus_inputs, solver_input
+from solutions.parsing import ArgsModel, build_parser
+from solutions.registry import solution_functions
+from solutions.timing import solve_captured
+
+
+@dataclass(frozen=True)
+class Job:
+    day_number: int
+    version: int
+    input_filepath: str
+
+
+@dataclass(frozen=True)
+class JobResult:
+    job: Job
+    answer: str | None
+    output: str
+    error: str | None
+    elapsed_ns: int
+
+
+def main(argv: list[str]) -> None:
+    parser = build_parser(PoolArgs)
+    args = parser.parse(argv)
+    jobs = build_jobs(args.corpus, args.day_number, args.version)
+    start = time.perf_counter_ns()
+    failures = 0
+    busy_ns = 0
+    solve = partial(
+        solve_job,
+        use_cache=not args.no_cache,
+        refresh=args.refresh,
+        budget=args.budget,
+    )
+    for result in run_jobs(jobs, args.workers, solve):
+        busy_ns += result.elapsed_ns
+        failures += result.error is not None
+        print(format_result(result), flush=True)
+    wall_ns = time.perf_counter_ns() - start
+    print(
+        json.dumps(
+            {
+                "jobs": len(jobs),
+                "failures": failures,
+                "wall_ms": wall_ns / 1_000_000,
+                "busy_ms": busy_ns / 1_000_000,
+            }
+        )
+    )
+    if failures:
+        sys.exit(1)
+
+
+class PoolArgs(ArgsModel):
+    corpus: str = "inputs"
+    day_number: int | None = None
+    version: int | None = None
+    workers: int | None = None
+    no_cache: bool
+    refresh: bool
+    budget: float | None = None
+
+    class Meta:
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {
+            "corpus": "corpus",
+            "day_number": ("d", "day"),
+            "version": ("v", "version"),
+            "workers": ("j", "workers"),
+            "no_cache": "no-cache",
+            "budget": "budget",
+        }
+
+
+def build_jobs(
+    corpus_dir: str, day_number: int | None = None, version: int | None = None
+) -> list[Job]:
+    return [
+        Job(day, v, input_filepath)
+        for day, input_filepaths in corpus_inputs(corpus_dir).items()
+        if day_number is None or day == day_number
+        for v in range(len(solution_functions.get(day, [])))
+        if version is None or v == version
+        for input_filepath in input_filepaths
+    ]
+
+
+def run_jobs(
+    jobs: list[Job],
+    workers: int | None = None,
+    solve: Callable[[Job], JobResult] | None = None,
+) -> Iterator[JobResult]:
+    """
+    Yields results in the order the jobs finish. A job that raises is reported
+    as a failed result rather than stopping the rest. Defaults to one worker
+    per core.
+
+    A worker that dies (e.g. killed for running out of memory) breaks the whole
+    pool, and there's no telling which job it was running. The jobs that were
+    still unfinished are then rerun one per fresh single-worker pool, so that
+    a job that kills its worker fails on its own.
+    """
+    solve = solve or solve_job
+    unfinished: list[Job] = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures: dict[Future[JobResult], Job] = {
+            executor.submit(solve, job): job for job in jobs
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                unfinished.append(futures[future])
+            except Exception as e:
+                yield JobResult(futures[future], None, "", repr(e), 0)
+    for job in unfinished:
+        yield run_isolated(job, solve)
+
+
+def run_isolated(job: Job, solve: Callable[[Job], JobResult]) -> JobResult:
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(solve, job).result()
+        except Exception as e:
+            return JobResult(job, None, "", repr(e), 0)
+
+
+def solve_job(
+    job: Job,
+    use_cache: bool = False,
+    refresh: bool = False,
+    budget: float | None = None,
+) -> JobResult:
+    with time_budget(budget), solve_captured() as solved:
+        solver = solution_functions[job.day_number][job.version]
+        if use_cache:
+            solved.time(
+                lambda: solve_cached(
+                    solver,
+                    job.day_number,
+                    job.version,
+                    job.input_filepath,
+                    refresh=refresh,
+                )
+            )
+        else:
+            with solver_input(solver, job.input_filepath) as inputs:
+                solved.time(lambda: solver(inputs, False))
+    return JobResult(job, solved.answer, solved.output, solved.error, solved.elapsed_ns)
+
+
+def format_result(result: JobResult) -> str:
+    return json.dumps(
+        {
+            **asdict(result.job),
+            "answer": result.answer,
+            "output": result.output,
+            "error": result.error,
+            "elapsed_ms": result.elapsed_ns / 1_000_000,
+        }
+    )
@@ -0,0 +1,261 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from types import CodeType
+from typing import Callable, Iterator, TypeVar
+
+C = TypeVar("C", bound=Callable)
+
+HOT_PATHS_ENABLED = os.environ.get("AOC_HOT_PATHS") == "1"
+TRACE_FRAMES = 1
+SNAPSHOT_MIN_BYTES = 1024 * 1024
+SAMPLE_INTERVAL = 0.005
+
+
+class HotPathTimers:
+    totals: dict[str, float]
+    calls: dict[str, int]
+    _active: set[str]
+
+    def __init__(self) -> None:
+        self.totals = {}
+        self.calls = {}
+        self._active = set()
+
+    def reset(self) -> None:
+        self.totals.clear()
+        self.calls.clear()
+        self._active.clear()
+
+    def report(self, top_n: int = 10) -> list[str]:
+        busiest = sorted(self.totals, key=lambda k: self.totals[k], reverse=True)
+        return [
+            f"{key}: {self.totals[key]:.6f}s over {self.calls[key]} calls"
+            for key in busiest[:top_n]
+        ]
+
+
+hot_path_timers = HotPathTimers()
+
+
+def enable_hot_paths() -> None:
+    """
+    Must be called before the decorated modules are imported, since `hot_path`
+    decides whether to wrap a function when it is applied.
+    """
+    global HOT_PATHS_ENABLED
+    HOT_PATHS_ENABLED = True
+
+
+def hot_path(func: C) -> C:
+    """
+    Accumulates time spent in `func` into `hot_path_timers`. When hot paths
+    aren't enabled the function is returned unwrapped, so it costs nothing.
+    Recursive calls are only timed at the outermost call.
+    """
+    if not HOT_PATHS_ENABLED:
+        return func
+    key = func.__qualname__
+    timers = hot_path_timers
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if key in timers._active:
+            return func(*args, **kwargs)
+        timers._active.add(key)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timers.totals[key] = timers.totals.get(key, 0) + time.perf_counter() - start
+            timers.calls[key] = timers.calls.get(key, 0) + 1
+            timers._active.remove(key)
+
+    return wrapper  # type: ignore
+
+
+@contextmanager
+def profile(output_filepath: str, top_n: int = 20) -> Iterator[cProfile.Profile]:
+    """Writes pstats to `output_filepath` and prints the top functions."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output_filepath)
+        print(f"Profile written to {output_filepath}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(top_n)
+
+
+@dataclass
+class StackSamples:
+    interval: float
+    counts: Counter[tuple[CodeType, ...]] = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def collapsed(self) -> list[str]:
+        """One `outer;...;inner count` line per distinct stack, for flamegraphs."""
+        return [
+            f"{';'.join(map(frame_label, stack))} {count}"
+            for stack, count in self.counts.most_common()
+        ]
+
+    def report(self, top_n: int = 10) -> list[str]:
+        """The functions most often on top of the stack, i.e. by self time."""
+        tops: Counter[CodeType] = Counter()
+        for stack, count in self.counts.items():
+            tops[stack[-1]] += count
+        total = self.total or 1
+        return [
+            f"{self.total} stack samples, one every {self.interval * 1000:g} ms"
+        ] + [
+            f"{frame_label(code)}: {count / total:.1%}"
+            for code, count in tops.most_common(top_n)
+        ]
+
+
+def frame_label(code: CodeType) -> str:
+    return f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+
+
+@contextmanager
+def sample_stacks(
+    output_filepath: str, interval: float = SAMPLE_INTERVAL
+) -> Iterator[StackSamples]:
+    """
+    Samples the calling thread's stack from a background thread every
+    `interval` seconds and writes the collapsed stacks to `output_filepath`.
+    Unlike cProfile, nothing is added to each call, so solvers made of many
+    tiny methods aren't slowed out of shape: the cost is the walk up one
+    stack per sample. Stacks are kept as code objects until the end.
+    """
+    samples = StackSamples(interval)
+    target_id = threading.get_ident()
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target_id)
+            stack: list[CodeType] = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if done.is_set():
+                break
+            samples.counts[tuple(reversed(stack))] += 1
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        yield samples
+    finally:
+        done.set()
+        sampler.join()
+        with open(output_filepath, "w") as f:
+            f.writelines(f"{line}\n" for line in samples.collapsed())
+        print(f"Stack samples written to {output_filepath}")
+
+
+@dataclass
+class AllocationSite:
+    filename: str
+    lineno: int
+    size_bytes: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    peak_bytes: int = 0
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+    def report(self) -> list[str]:
+        return [f"Peak traced memory: {format_bytes(self.peak_bytes)}"] + [
+            f"{site.filename}:{site.lineno}: "
+            f"{format_bytes(site.size_bytes)} in {site.count} blocks"
+            for site in self.top_sites
+        ]
+
+
+@contextmanager
+def trace_memory(top_n: int = 10, interval: float = 0.01) -> Iterator[MemoryReport]:
+    """
+    Fills in the yielded report when the block exits. Whatever a solver
+    allocates is mostly freed by the time it returns, so allocation sites come
+    from a snapshot taken by a background thread whenever traced memory
+    doubles, rather than from a snapshot at the end. A snapshot copies every
+    live trace, so taking them any more often costs more than the solver.
+
+    Only one frame is kept per allocation. The watcher is started before
+    tracing is, and once running it only allocates from this module,
+    `threading` and `tracemalloc`, so leaving out those files leaves out
+    the watcher. This only works if tracing wasn't already started elsewhere.
+    """
+    report = MemoryReport()
+    peak_snapshot: list[tuple[int, tracemalloc.Snapshot]] = []
+    done = threading.Event()
+
+    def watch() -> None:
+        high_bytes = SNAPSHOT_MIN_BYTES
+        while not done.wait(interval):
+            current_bytes, _ = tracemalloc.get_traced_memory()
+            if current_bytes > high_bytes * 2:
+                high_bytes = current_bytes
+                peak_snapshot.clear()
+                peak_snapshot.append((current_bytes, tracemalloc.take_snapshot()))
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACE_FRAMES)
+    tracemalloc.reset_peak()
+    baseline_bytes, _ = tracemalloc.get_traced_memory()
+    try:
+        yield report
+    finally:
+        done.set()
+        watcher.join()
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        if not peak_snapshot or peak_snapshot[0][0] < current_bytes:
+            peak_snapshot.clear()
+            peak_snapshot.append((current_bytes, tracemalloc.take_snapshot()))
+        if not was_tracing:
+            tracemalloc.stop()
+        report.peak_bytes = peak_bytes - baseline_bytes
+        report.top_sites = [
+            AllocationSite(
+                stat.traceback[0].filename,
+                stat.traceback[0].lineno,
+                stat.size,
+                stat.count,
+            )
+            for stat in peak_snapshot[0][1].statistics("lineno")
+            if not is_watcher_file(stat.traceback[0].filename)
+        ][:top_n]
+
+
+def is_watcher_file(filename: str) -> bool:
+    """
+    Filtering the statistics rather than the snapshot's traces, which is the
+    same with one frame per allocation, saves a slow pass over every trace.
+    """
+    return filename in (__file__, tracemalloc.__file__, threading.__file__) or (
+        filename.startswith("<frozen importlib._bootstrap")
+    )
+
+
+def format_bytes(size_bytes: int) -> str:
+    return f"{size_bytes / 1024 / 1024:.2f} MiB"
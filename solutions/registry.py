@@ -0,0 +1,71 @@
+import importlib
+import os
+import re
+from functools import cached_property
+from typing import Any, Callable, Iterator, Mapping
+
+Solver = Callable[[list[str], bool], Any]
+
+DAY_MODULE_RE = r"day(?P<day_number>\d\d)$"
+VERSION_NAMES = ("alpha", "beta", "gamma", "delta", "epsilon")
+
+
+class SolutionRegistry(Mapping[int, list[Solver]]):
+    """
+    Day modules are only imported the first time their day is looked up, so
+    running one day doesn't pay for importing every other day.
+    A day's versions are whichever of `VERSION_NAMES` its module defines.
+    """
+
+    package: str
+    _loaded: dict[int, list[Solver]]
+
+    def __init__(self, package: str = "solutions") -> None:
+        self.package = package
+        self._loaded = {}
+
+    def __getitem__(self, day_number: int) -> list[Solver]:
+        if day_number not in self._loaded:
+            if day_number not in self.day_numbers:
+                raise KeyError(day_number)
+            module = importlib.import_module(
+                f"{self.package}.{day_module_name(day_number)}"
+            )
+            self._loaded[day_number] = [
+                getattr(module, name) for name in VERSION_NAMES if hasattr(module, name)
+            ]
+        return self._loaded[day_number]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.day_numbers)
+
+    def __len__(self) -> int:
+        return len(self.day_numbers)
+
+    @cached_property
+    def day_numbers(self) -> tuple[int, ...]:
+        """
+        Scans the package directory itself rather than using `pkgutil`, which
+        imports `inspect` and would add to every run's startup time.
+        """
+        day_numbers: set[int] = set()
+        for package_path in importlib.import_module(self.package).__path__:
+            for entry in os.scandir(package_path):
+                if entry.is_dir():
+                    if not os.path.exists(os.path.join(entry.path, "__init__.py")):
+                        continue
+                    module_name = entry.name
+                elif entry.name.endswith(".py"):
+                    module_name = entry.name.removesuffix(".py")
+                else:
+                    continue
+                if match := re.match(DAY_MODULE_RE, module_name):
+                    day_numbers.add(int(match.group("day_number")))
+        return tuple(sorted(day_numbers))
+
+
+def day_module_name(day_number: int) -> str:
+    return f"day{day_number:02}"
+
+
+solution_functions = SolutionRegistry()
@@ -0,0 +1,263 @@
+import json
+import math
+import os
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from solutions.inputs import read_input
+from solutions.parsing import ArgsModel, build_parser
+from solutions.registry import Solver, solution_functions
+from solutions.timing import format_ns, measure, quiet
+
+MODES = ("prefix", "replicate", "generate")
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    size: int
+    min_ns: int
+    peak_bytes: int
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    key: str
+    points: list[SweepPoint]
+    time_exponent: float
+    memory_exponent: float
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "key": self.key,
+                "points": [asdict(point) for point in self.points],
+                "time_exponent": self.time_exponent,
+                "memory_exponent": self.memory_exponent,
+            }
+        )
+
+
+def main(argv: list[str]) -> None:
+    parser = build_parser(SweepArgs)
+    args = parser.parse(argv)
+    if args.mode not in MODES:
+        parser.arg_parser.error(f"--mode must be one of {', '.join(MODES)}")
+    if args.mode != "generate" and args.input_filepath is None:
+        parser.arg_parser.error(f"input_filepath is required with --mode {args.mode}")
+    day_solvers = solution_functions.get(args.day_number, [])
+    if len(day_solvers) <= args.version:
+        parser.arg_parser.error(
+            f"No solution of day {args.day_number} and version {args.version}."
+        )
+    solver = day_solvers[args.version]
+    if args.mode == "generate":
+        from solutions.generators import generate, get_default_size
+
+        largest = args.size or get_default_size(args.day_number)
+        sized_inputs = [
+            (size, generate(args.day_number, size, args.seed))
+            for size in halvings(largest, args.steps)
+        ]
+    else:
+        input_strs = read_input(args.input_filepath)
+        scale = prefixes if args.mode == "prefix" else replications
+        sized_inputs = scale(input_strs, args.steps)
+
+    result = sweep(
+        solver,
+        sweep_key(args.day_number, args.version, args.mode),
+        sized_inputs,
+        repeats=args.repeats,
+    )
+    if args.json:
+        print(result.to_json())
+    else:
+        for line in format_table(result):
+            print(line)
+
+    jumps: list[str] = []
+    if args.baseline is not None:
+        baseline = read_baseline(args.baseline)
+        if args.update or result.key not in baseline:
+            baseline[result.key] = result
+            write_baseline(args.baseline, baseline)
+            print(f"Wrote {result.key} to {args.baseline}")
+        else:
+            jumps = find_exponent_jumps(baseline, [result], args.tolerance)
+            for jump in jumps:
+                print(f"EXPONENT JUMP {jump}")
+    if jumps:
+        sys.exit(1)
+
+
+class SweepArgs(ArgsModel):
+    day_number: int
+    input_filepath: str | None = None
+    version: int = 0
+    mode: str = "prefix"
+    steps: int = 5
+    size: int | None = None
+    seed: int = 0
+    repeats: int = 3
+    json: bool
+    baseline: str | None = None
+    tolerance: float = 0.3
+    update: bool
+
+    class Meta:
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {
+            "version": ("v", "version"),
+            "mode": "mode",
+            "steps": "steps",
+            "size": ("n", "size"),
+            "seed": ("s", "seed"),
+            "repeats": ("r", "repeats"),
+            "baseline": "baseline",
+            "tolerance": "tolerance",
+        }
+
+
+def sweep_key(day_number: int, version: int, mode: str) -> str:
+    return f"day{day_number:02}:v{version}:{mode}"
+
+
+def halvings(largest: int, steps: int) -> list[int]:
+    """`steps` sizes ending at `largest`, each half the next, smallest first."""
+    sizes = {max(largest >> shift, 1) for shift in range(steps)}
+    return sorted(sizes)
+
+
+def prefixes(input_strs: list[str], steps: int) -> list[tuple[int, list[str]]]:
+    """
+    Leading slices of the input, halving in length. Only inputs that are a
+    list of independent records stay valid when cut short.
+    """
+    return [(size, input_strs[:size]) for size in halvings(len(input_strs), steps)]
+
+
+def replications(input_strs: list[str], steps: int) -> list[tuple[int, list[str]]]:
+    """The input repeated 1, 2, 4, ... times, for inputs too small to cut up."""
+    return [
+        (len(input_strs) << shift, input_strs * (1 << shift)) for shift in range(steps)
+    ]
+
+
+def sweep(
+    solver: Solver,
+    key: str,
+    sized_inputs: list[tuple[int, list[str]]],
+    repeats: int = 3,
+) -> SweepResult:
+    """
+    Times each input, then solves it once more under tracemalloc for its peak
+    memory. Tracing slows allocation down, so the two are never measured in
+    the same run.
+    """
+    points: list[SweepPoint] = []
+    for size, inputs in sized_inputs:
+        with quiet():
+            _, stats = measure(
+                lambda: solver(list(inputs), False), warmups=0, repeats=repeats
+            )
+            peak_bytes = peak_memory(lambda: solver(list(inputs), False))
+        points.append(SweepPoint(size, stats.min_ns, peak_bytes))
+    return SweepResult(
+        key=key,
+        points=points,
+        time_exponent=fit_exponent([(p.size, p.min_ns) for p in points]),
+        memory_exponent=fit_exponent([(p.size, p.peak_bytes) for p in points]),
+    )
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def fit_exponent(samples: list[tuple[int, int]]) -> float:
+    """
+    The slope of the least-squares line through log(cost) against log(size),
+    so a cost growing like size ** k gives k. Samples that can't be logged
+    are skipped, and with fewer than two sizes left there's nothing to fit.
+    """
+    points = [
+        (math.log(size), math.log(cost))
+        for size, cost in samples
+        if size > 0 and cost > 0
+    ]
+    if len({x for x, _ in points}) < 2:
+        return math.nan
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def format_table(result: SweepResult) -> list[str]:
+    lines = [result.key, f"{'size':>10} {'min time':>14} {'peak memory':>14}"]
+    for point in result.points:
+        lines.append(
+            f"{point.size:>10} {format_ns(point.min_ns):>14} "
+            f"{point.peak_bytes / 1024:>11.1f} KiB"
+        )
+    lines.append(
+        f"time ~ n^{result.time_exponent:.2f}, memory ~ n^{result.memory_exponent:.2f}"
+    )
+    return lines
+
+
+def write_baseline(baseline_filepath: str, results: dict[str, SweepResult]) -> None:
+    with open(baseline_filepath, "w") as f:
+        json.dump(
+            {
+                key: json.loads(result.to_json())
+                for key, result in sorted(results.items())
+            },
+            f,
+            indent=2,
+        )
+
+
+def read_baseline(baseline_filepath: str) -> dict[str, SweepResult]:
+    if not os.path.exists(baseline_filepath):
+        return {}
+    with open(baseline_filepath) as f:
+        return {
+            key: SweepResult(
+                key=key,
+                points=[SweepPoint(**point) for point in result["points"]],
+                time_exponent=result["time_exponent"],
+                memory_exponent=result["memory_exponent"],
+            )
+            for key, result in json.load(f).items()
+        }
+
+
+def find_exponent_jumps(
+    baseline: dict[str, SweepResult],
+    results: list[SweepResult],
+    tolerance: float,
+) -> list[str]:
+    """Sweeps whose time or memory exponent moved by more than `tolerance`."""
+    jumps: list[str] = []
+    for result in results:
+        if result.key not in baseline:
+            continue
+        before = baseline[result.key]
+        for name, old, new in (
+            ("time", before.time_exponent, result.time_exponent),
+            ("memory", before.memory_exponent, result.memory_exponent),
+        ):
+            if abs(new - old) > tolerance:
+                jumps.append(
+                    f"{result.key}: {name} exponent {new:.2f} vs baseline "
+                    f"{old:.2f} (tolerance {tolerance})"
+                )
+    return jumps
@@ -0,0 +1,44 @@
+import json
+import os
+
+import pytest
+
+from .batch import batch_inputs, print_batch, run_batch
+from .registry import solution_functions
+
+
+@pytest.fixture
+def input_dir(tmp_path: str) -> str:
+    with open(os.path.join(tmp_path, "a.txt"), "w") as f:
+        f.write("noop\n" * 240)
+    with open(os.path.join(tmp_path, "b.txt"), "w") as f:
+        f.write("bogus 1\n")
+    os.makedirs(os.path.join(tmp_path, "nested"))
+    with open(os.path.join(tmp_path, "nested", "c.txt"), "w") as f:
+        f.write("addx 3\n" * 120)
+    return str(tmp_path)
+
+
+def test_batch_inputs(input_dir: str) -> None:
+    relative = [os.path.relpath(p, input_dir) for p in batch_inputs(input_dir)]
+    assert relative == ["a.txt", "b.txt"]
+    relative = [os.path.relpath(p, input_dir) for p in batch_inputs(input_dir, "**")]
+    assert relative == ["a.txt", "b.txt", os.path.join("nested", "c.txt")]
+
+
+def test_run_batch_keeps_output(input_dir: str) -> None:
+    results = list(run_batch(solution_functions[10][0], batch_inputs(input_dir)))
+    assert results[0].error is None
+    assert results[0].output.count("\n") == 6
+    assert results[1].answer is None
+    assert "KeyError" in results[1].error
+
+
+def test_print_batch(input_dir: str, capsys: pytest.CaptureFixture) -> None:
+    failures = print_batch(solution_functions[10][0], batch_inputs(input_dir, "**"))
+    assert failures == 1
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["file"] for line in lines[:3]] == batch_inputs(input_dir, "**")
+    assert "#" in lines[0]["output"]
+    assert lines[3]["files"] == 3
+    assert lines[3]["failures"] == 1
@@ -0,0 +1,54 @@
+import os
+
+from .bench import bench_key, find_regressions, read_baseline, write_baseline
+from .timing import TimingStats, measure
+
+
+def stats(median_ns: int) -> TimingStats:
+    return TimingStats(
+        min_ns=median_ns, median_ns=median_ns, p95_ns=median_ns, repeats=5
+    )
+
+
+def test_from_samples() -> None:
+    result = TimingStats.from_samples([50, 10, 40, 20, 30])
+    assert result == TimingStats(min_ns=10, median_ns=30, p95_ns=50, repeats=5)
+
+
+def test_from_samples_p95() -> None:
+    result = TimingStats.from_samples(list(range(1, 101)))
+    assert result.min_ns == 1
+    assert result.median_ns == 50
+    assert result.p95_ns == 95
+    assert result.repeats == 100
+
+
+def test_from_single_sample() -> None:
+    assert TimingStats.from_samples([7]) == TimingStats(7, 7, 7, 1)
+
+
+def test_measure() -> None:
+    calls: list[int] = []
+    value, result = measure(lambda: calls.append(1) or len(calls), warmups=2, repeats=3)
+    assert value == 5
+    assert result.repeats == 3
+
+
+def test_find_regressions() -> None:
+    baseline = {"a": stats(100), "b": stats(100), "c": stats(100)}
+    results = {"a": stats(119), "b": stats(121), "d": stats(1000)}
+    regressions = find_regressions(baseline, results, 0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b:")
+
+
+def test_no_regressions_when_faster() -> None:
+    assert find_regressions({"a": stats(100)}, {"a": stats(10)}, 0.0) == []
+
+
+def test_baseline_round_trip(tmp_path: str) -> None:
+    baseline_filepath = os.path.join(tmp_path, "baseline.json")
+    results = {bench_key(1, 0, "inputs/day01.txt"): stats(100)}
+    write_baseline(baseline_filepath, results)
+    assert read_baseline(baseline_filepath) == results
+    assert list(results) == ["day01:v0:day01.txt"]
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from .budget import NonOptimal, budget_expired, flagged, is_optimal, time_budget
+from .cache import ResultCache, solve_cached
+from .generators import generate
+from .registry import solution_functions
+
+
+def test_no_budget_never_expires() -> None:
+    assert not budget_expired()
+    with time_budget(None):
+        assert not budget_expired()
+
+
+def test_budget_expires_and_resets() -> None:
+    with time_budget(0.01):
+        assert not budget_expired()
+        time.sleep(0.02)
+        assert budget_expired()
+    assert not budget_expired()
+
+
+def test_non_optimal_is_an_int() -> None:
+    value = NonOptimal(5)
+    assert value == 5 and value + 1 == 6
+    assert repr((value, 3)) == "(NonOptimal(5), 3)"
+    assert not is_optimal((3, value))
+    assert is_optimal((3, 5))
+
+
+def test_flagged() -> None:
+    assert type(flagged(6, 2, 3)) is int
+    assert flagged(6, 2, NonOptimal(3)) == NonOptimal(6)
+    assert isinstance(flagged(6, 2, NonOptimal(3)), NonOptimal)
+
+
+@pytest.mark.parametrize("day_number, size", [(16, 15), (19, 3)])
+def test_searches_stop_at_the_budget(day_number: int, size: int) -> None:
+    inputs = generate(day_number, size, 0)
+    start = time.monotonic()
+    with time_budget(0.2):
+        part1, part2 = solution_functions[day_number][0](inputs, False)
+    assert time.monotonic() - start < 5
+    assert not is_optimal((part1, part2))
+    assert part1 >= 0 and part2 >= 0
+
+
+def test_non_optimal_answers_are_not_cached(tmp_path) -> None:
+    input_filepath = tmp_path / "input.txt"
+    input_filepath.write_text("1\n")
+    cache = ResultCache(str(tmp_path / "cache"))
+    calls: list[int] = []
+
+    def solver(inputs: list[str], debug: bool) -> tuple[int, int]:
+        calls.append(1)
+        return NonOptimal(1), 2
+
+    for _ in range(2):
+        answer = solve_cached(solver, 1, 0, str(input_filepath), cache=cache)
+        assert not is_optimal(answer)
+    assert len(calls) == 2
@@ -0,0 +1,135 @@
+import os
+import sys
+
+import pytest
+
+from . import cache
+from .cache import CachedResult, ResultCache, day_source_digest, solve_cached
+
+
+@pytest.fixture
+def result_cache(tmp_path: str) -> ResultCache:
+    return ResultCache(os.path.join(tmp_path, "cache"))
+
+
+@pytest.fixture
+def input_filepath(tmp_path: str) -> str:
+    input_filepath = os.path.join(tmp_path, "day01.txt")
+    with open(input_filepath, "w") as f:
+        f.write("1\n2\n\n3\n")
+    return input_filepath
+
+
+class CountingSolver:
+    calls: int
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, inputs: list[str], debug: bool) -> int:
+        self.calls += 1
+        print("solving")
+        return len(list(inputs))
+
+
+def test_miss_then_hit(
+    result_cache: ResultCache, input_filepath: str, capsys: pytest.CaptureFixture
+) -> None:
+    solver = CountingSolver()
+    assert solve_cached(solver, 1, 0, input_filepath, cache=result_cache) == 4
+    assert solve_cached(solver, 1, 0, input_filepath, cache=result_cache) == 4
+    assert solver.calls == 1
+    assert capsys.readouterr().out == "solving\nsolving\n"
+
+
+def test_refresh(result_cache: ResultCache, input_filepath: str) -> None:
+    solver = CountingSolver()
+    solve_cached(solver, 1, 0, input_filepath, cache=result_cache)
+    solve_cached(solver, 1, 0, input_filepath, refresh=True, cache=result_cache)
+    assert solver.calls == 2
+
+
+def test_input_change(result_cache: ResultCache, input_filepath: str) -> None:
+    solver = CountingSolver()
+    solve_cached(solver, 1, 0, input_filepath, cache=result_cache)
+    with open(input_filepath, "a") as f:
+        f.write("4\n")
+    assert solve_cached(solver, 1, 0, input_filepath, cache=result_cache) == 5
+    assert solver.calls == 2
+
+
+def test_version_change(result_cache: ResultCache, input_filepath: str) -> None:
+    solver = CountingSolver()
+    solve_cached(solver, 1, 0, input_filepath, cache=result_cache)
+    solve_cached(solver, 1, 1, input_filepath, cache=result_cache)
+    assert solver.calls == 2
+
+
+def test_source_change(
+    result_cache: ResultCache, input_filepath: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    solver = CountingSolver()
+    solve_cached(solver, 1, 0, input_filepath, cache=result_cache)
+    monkeypatch.setattr(cache, "day_source_digest", lambda day_number: "edited")
+    solve_cached(solver, 1, 0, input_filepath, cache=result_cache)
+    assert solver.calls == 2
+
+
+def test_day_source_digest() -> None:
+    assert day_source_digest(1) == day_source_digest(1)
+    assert day_source_digest(1) != day_source_digest(2)
+    assert len(day_source_digest(16)) == 64
+    with pytest.raises(ModuleNotFoundError):
+        day_source_digest(25)
+
+
+def test_eviction(tmp_path: str) -> None:
+    result_cache = ResultCache(os.path.join(tmp_path, "cache"))
+    for n in range(5):
+        result_cache.put(f"key{n}", CachedResult("x" * 50, ""))
+        os.utime(result_cache._path(f"key{n}"), (n, n))
+    result_cache.max_bytes = 5 * os.path.getsize(result_cache._path("key0"))
+    result_cache.get("key0")
+    result_cache.put("key5", CachedResult("x" * 50, ""))
+    assert result_cache.get("key0") is not None
+    assert result_cache.get("key1") is None
+    assert result_cache.get("key5") is not None
+
+
+def test_eviction_race(tmp_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Another process can evict an entry between listing and stat-ing it."""
+    result_cache = ResultCache(os.path.join(tmp_path, "cache"), max_bytes=0)
+    result_cache.put("key0", CachedResult(1, ""))
+    scandir = os.scandir
+
+    def scandir_then_evict(path: str) -> list[os.DirEntry]:
+        entries = list(scandir(path))
+        for entry in entries:
+            os.remove(entry.path)
+        return entries
+
+    monkeypatch.setattr(cache.os, "scandir", scandir_then_evict)
+    result_cache.put("key1", CachedResult(1, ""))
+
+
+def test_corrupt_entry(result_cache: ResultCache) -> None:
+    result_cache.put("key", CachedResult(1, ""))
+    with open(result_cache._path("key"), "wb") as f:
+        f.write(b"not a pickle")
+    assert result_cache.get("key") is None
+
+
+def test_timeit_skips_the_cache(
+    input_filepath: str,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    from . import __main__
+
+    def cache_hit(*args: object, **kwargs: object) -> None:
+        raise AssertionError("--timeit timed a cache lookup")
+
+    monkeypatch.setattr(cache, "solve_cached", cache_hit)
+    monkeypatch.setattr(sys, "argv", ["solutions", "1", input_filepath, "--timeit"])
+    __main__.main()
+    assert capsys.readouterr().out.startswith("(3, 6)\nTotal runtime: ")
@@ -0,0 +1,46 @@
+import pytest
+
+from .compare import AnswerMismatchError, compare_versions, format_comparison
+from .generators import generate
+from .registry import solution_functions
+
+
+def alpha(inputs: list[str], debug: bool) -> tuple[int, int]:
+    print("printed output is not part of the comparison")
+    return len(inputs), sum(map(len, inputs))
+
+
+def beta(inputs: list[str], debug: bool) -> tuple[int, int]:
+    return len(inputs), len("".join(inputs))
+
+
+def gamma(inputs: list[str], debug: bool) -> tuple[int, int]:
+    inputs.pop()
+    return len(inputs), 0
+
+
+def test_versions_agree(capsys) -> None:
+    timings = compare_versions([alpha, beta], ["ab", "cde"], warmups=0, repeats=2)
+    assert capsys.readouterr().out == ""
+    assert [(t.version, t.name, t.answer) for t in timings] == [
+        (0, "alpha", (2, 5)),
+        (1, "beta", (2, 5)),
+    ]
+    assert all(t.stats.repeats == 2 for t in timings)
+    header, *rows = format_comparison(timings)
+    assert rows[0].startswith("v0 alpha") and rows[0].endswith("1.00x")
+    assert rows[1].startswith("v1 beta")
+
+
+def test_versions_disagree() -> None:
+    with pytest.raises(AnswerMismatchError, match=r"v0 \(2, 5\), v1 \(1, 0\)"):
+        compare_versions([alpha, gamma], ["ab", "cde"], warmups=0, repeats=1)
+
+
+@pytest.mark.parametrize("day_number", [6, 8, 9])
+def test_shipped_versions_agree(day_number: int) -> None:
+    inputs = generate(day_number, 50, 0)
+    timings = compare_versions(
+        solution_functions[day_number], inputs, warmups=0, repeats=1
+    )
+    assert len(timings) == 2
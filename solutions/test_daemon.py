@@ -0,0 +1,73 @@
+import asyncio
+import json
+import os
+import socket
+
+import pytest
+
+from .daemon import SocketInUseError, handle_request, request, serve, socket_in_use
+
+DAY01_INPUT = "1000\n2000\n\n3000\n\n500\n"
+
+
+def test_handle_request() -> None:
+    line = json.dumps({"day": 1, "version": 0, "input": DAY01_INPUT}).encode()
+    response = handle_request(line)
+    assert response["error"] is None
+    assert response["answer"] == repr((3000, 6500))
+    assert response["elapsed_ms"] >= 0
+
+
+def test_handle_request_output() -> None:
+    line = json.dumps({"day": 10, "input": "noop\n" * 240}).encode()
+    response = handle_request(line)
+    assert response["error"] is None
+    assert response["output"].count("\n") == 6
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        b"not json",
+        json.dumps({"day": 99, "input": ""}).encode(),
+        json.dumps({"day": 1, "version": 5, "input": ""}).encode(),
+        json.dumps({"day": 1}).encode(),
+    ],
+)
+def test_handle_bad_request(line: bytes) -> None:
+    response = handle_request(line)
+    assert response["answer"] is None
+    assert response["error"] is not None
+
+
+@pytest.fixture
+def socket_path(tmp_path: str) -> str:
+    return os.path.join(tmp_path, "aoc.sock")
+
+
+def test_socket_in_use(socket_path: str) -> None:
+    assert not socket_in_use(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(socket_path)
+        assert not socket_in_use(socket_path)
+        server.listen()
+        assert socket_in_use(socket_path)
+        with pytest.raises(SocketInUseError):
+            asyncio.run(serve(socket_path))
+    assert os.path.exists(socket_path)
+
+
+def test_serve_round_trip(socket_path: str) -> None:
+    async def round_trip() -> dict:
+        server_task = asyncio.create_task(serve(socket_path))
+        try:
+            while not os.path.exists(socket_path):
+                await asyncio.sleep(0.01)
+            return await asyncio.to_thread(request, 1, 0, DAY01_INPUT, socket_path)
+        finally:
+            server_task.cancel()
+            await asyncio.gather(server_task, return_exceptions=True)
+
+    response = asyncio.run(round_trip())
+    assert response["answer"] == repr((3000, 6500))
+    assert not os.path.exists(socket_path)
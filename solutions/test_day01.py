@@ -0,0 +1,136 @@
+import math
+
+import pytest
+
+from .day01 import (
+    QuantileSketch,
+    alpha,
+    beta,
+    bulk_group_totals,
+    chunk_bounds,
+    gamma,
+    group_totals,
+    parallel_top_totals,
+    top_totals,
+    total_quantiles,
+)
+from .generators import generate
+from .sweep import peak_memory
+
+EXAMPLE = "1000 2000 3000  4000  5000 6000  7000 8000 9000  10000".split(" ")
+
+
+def test_example() -> None:
+    assert alpha(EXAMPLE) == (24000, 45000)
+    assert alpha(iter(EXAMPLE)) == (24000, 45000)
+
+
+def test_bulk_parse_matches_line_parse() -> None:
+    inputs = generate(1, 500, 0)
+    data = "\n".join(inputs).encode()
+    assert beta(inputs) == alpha(inputs)
+    assert beta(memoryview(data)) == alpha(inputs)
+    assert beta(memoryview(data.replace(b"\n", b"\r\n") + b"\r\n")) == alpha(inputs)
+
+
+def test_bulk_group_totals() -> None:
+    data = "\n".join(EXAMPLE).encode()
+    assert list(bulk_group_totals(data)) == list(group_totals(EXAMPLE))
+    assert list(bulk_group_totals(b"1\n\n\n2\n")) == [1, 2]
+    assert list(bulk_group_totals(b"")) == [0]
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n"])
+@pytest.mark.parametrize("chunks", [1, 2, 7, 1000])
+def test_chunk_bounds(newline: bytes, chunks: int) -> None:
+    data = newline.join(map(str.encode, generate(1, 50, 0))) + newline
+    bounds = chunk_bounds(data, chunks)
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(bounds, bounds[1:]))
+    assert all(data[:end].endswith(newline * 2) for _, end in bounds[:-1])
+    totals = [
+        total
+        for start, end in bounds
+        for total in group_totals(data[start:end].decode().splitlines())
+    ]
+    assert sorted(filter(None, totals)) == sorted(
+        filter(None, group_totals(data.decode().splitlines()))
+    )
+
+
+def test_parallel_top_totals() -> None:
+    inputs = generate(1, 2000, 0)
+    data = "\n".join(inputs).encode()
+    expected = top_totals(group_totals(inputs), 3)
+    assert parallel_top_totals(data, 3, workers=2, chunk_bytes=1000) == expected
+    assert parallel_top_totals(data, 3, workers=1, chunk_bytes=1000) == expected
+    assert gamma(inputs) == alpha(inputs)
+
+
+def test_group_totals() -> None:
+    assert list(group_totals(EXAMPLE)) == [6000, 4000, 11000, 24000, 10000]
+    assert list(group_totals(["1", "", ""])) == [1, 0, 0]
+    assert list(group_totals([])) == [0]
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 5, 8])
+def test_top_totals(k: int) -> None:
+    totals = [5, 1, 9, 3, 9, 7]
+    assert top_totals(iter(totals), k) == sorted(totals, reverse=True)[:k]
+
+
+def test_top_totals_memory_does_not_grow_with_groups() -> None:
+    def lines(groups: int):
+        for group in range(groups):
+            yield str(group % 1000)
+            yield ""
+
+    small = peak_memory(lambda: top_totals(group_totals(lines(1_000)), 3))
+    large = peak_memory(lambda: top_totals(group_totals(lines(100_000)), 3))
+    assert large < small + 4096
+
+
+def test_ties_are_kept() -> None:
+    assert alpha(["5", "", "5", "", "5", "", "1"]) == (5, 15)
+
+
+@pytest.mark.parametrize("relative_error", [0.001, 0.01, 0.05])
+def test_quantiles_are_within_the_relative_error(relative_error: float) -> None:
+    inputs = generate(1, 5000, 0)
+    totals = sorted(group_totals(inputs))
+    estimates = total_quantiles(inputs, [0, 0.25, 0.5, 0.99, 1], relative_error)
+    for q, estimate in estimates.items():
+        exact = totals[math.floor(q * (len(totals) - 1))]
+        assert abs(estimate - exact) <= relative_error * exact
+
+
+def test_sketch_memory_grows_with_the_log_of_the_largest_total() -> None:
+    sketch = QuantileSketch(0.01).update(range(1_000_000))
+    assert sketch.count == 1_000_000
+    assert len(sketch.buckets) <= math.log(1_000_000) / math.log(1.01 / 0.99) + 1
+
+
+def test_merged_sketches_match_one_sketch() -> None:
+    totals = list(group_totals(generate(1, 2000, 0)))
+    whole = QuantileSketch().update(totals)
+    merged = QuantileSketch().update(totals[:700])
+    merged.merge(QuantileSketch().update(totals[700:]))
+    assert merged.buckets == whole.buckets
+    assert merged.quantile(0.5) == whole.quantile(0.5)
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(0.05))
+
+
+def test_sketch_edge_cases() -> None:
+    sketch = QuantileSketch()
+    with pytest.raises(ValueError):
+        sketch.quantile(0.5)
+    sketch.update([0, 0, 100])
+    assert sketch.quantile(0.5) == 0
+    assert sketch.quantile(1) == pytest.approx(100, rel=0.01)
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+    with pytest.raises(ValueError):
+        sketch.add(-1)
+    with pytest.raises(ValueError):
+        QuantileSketch(0)
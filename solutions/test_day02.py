@@ -0,0 +1,28 @@
+from .day02 import PART_ONE_SCORES, PART_TWO_SCORES, alpha
+from .generators import generate
+
+
+def test_example() -> None:
+    assert alpha(["A Y", "B X", "C Z"]) == (15, 12)
+    assert alpha(iter(["A Y", "B X", "C Z"])) == (15, 12)
+
+
+def test_score_tables() -> None:
+    assert PART_ONE_SCORES == {
+        "A X": 4, "A Y": 8, "A Z": 3,
+        "B X": 1, "B Y": 5, "B Z": 9,
+        "C X": 7, "C Y": 2, "C Z": 6,
+    }  # fmt: skip
+    assert PART_TWO_SCORES == {
+        "A X": 3, "A Y": 4, "A Z": 8,
+        "B X": 1, "B Y": 5, "B Z": 9,
+        "C X": 2, "C Y": 6, "C Z": 7,
+    }  # fmt: skip
+
+
+def test_counts_match_summing_every_round() -> None:
+    inputs = generate(2, 1000, 0)
+    assert alpha(inputs) == (
+        sum(PART_ONE_SCORES[round_] for round_ in inputs),
+        sum(PART_TWO_SCORES[round_] for round_ in inputs),
+    )
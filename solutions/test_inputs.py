@@ -0,0 +1,131 @@
+import os
+import sys
+import threading
+
+import pytest
+
+from .inputs import (
+    PackedLines,
+    corpus_inputs,
+    input_kind,
+    iter_lines,
+    open_mapped,
+    read_input,
+    solver_input,
+    split_lines,
+)
+
+TEXTS = {
+    "plain": "1000\n2000\n\n3000\n",
+    "no trailing newline": "1000\n2000\n\n3000",
+    "crlf": "1000\r\n2000\r\n\r\n3000\r\n",
+    "blank lines at end": "a\n\n\n",
+    "single line": "abc",
+    "empty": "",
+}
+
+
+@pytest.fixture(params=TEXTS.values(), ids=TEXTS.keys())
+def input_filepath(request: pytest.FixtureRequest, tmp_path: str) -> str:
+    input_filepath = os.path.join(tmp_path, "input.txt")
+    with open(input_filepath, "w", newline="") as f:
+        f.write(request.param)
+    return input_filepath
+
+
+def test_split_lines(input_filepath: str) -> None:
+    with open(input_filepath, newline="") as f:
+        text = f.read()
+    assert split_lines(text) == read_input(input_filepath)
+
+
+def test_iter_lines(input_filepath: str) -> None:
+    with open_mapped(input_filepath) as mapped:
+        assert list(iter_lines(mapped)) == read_input(input_filepath)
+
+
+def test_pipes_are_read_as_they_arrive(tmp_path: str) -> None:
+    fifo_path = os.path.join(tmp_path, "input.fifo")
+    os.mkfifo(fifo_path)
+    writer = threading.Thread(target=write_fifo, args=(fifo_path, TEXTS["crlf"]))
+    writer.start()
+    with solver_input(
+        input_kind("lines")(lambda inputs, debug: inputs), fifo_path
+    ) as inputs:
+        assert list(inputs) == ["1000", "2000", "", "3000"]
+    writer.join()
+
+
+def write_fifo(fifo_path: str, text: str) -> None:
+    with open(fifo_path, "w", newline="") as f:
+        f.write(text)
+
+
+def test_solver_input_kinds(input_filepath: str) -> None:
+    with open(input_filepath, "rb") as f:
+        raw = f.read()
+
+    def solver(inputs, debug):
+        return inputs
+
+    with solver_input(solver, input_filepath) as inputs:
+        assert inputs == read_input(input_filepath)
+    with solver_input(input_kind("lines")(solver), input_filepath) as inputs:
+        assert list(inputs) == read_input(input_filepath)
+    with solver_input(input_kind("bytes")(solver), input_filepath) as inputs:
+        assert bytes(inputs) == raw
+    with solver_input(input_kind("packed")(solver), input_filepath) as inputs:
+        assert list(inputs) == read_input(input_filepath)
+
+
+def test_packed_lines(input_filepath: str) -> None:
+    lines = read_input(input_filepath)
+    packed = PackedLines.from_file(input_filepath)
+    assert len(packed) == len(lines)
+    assert list(packed) == lines
+    assert [packed[i] for i in range(-len(lines), len(lines))] == lines + lines
+    with pytest.raises(IndexError):
+        packed[len(lines)]
+    for start, stop, step in [
+        (None, None, None),
+        (1, None, None),
+        (None, -1, None),
+        (3, 1, None),
+        (None, None, 2),
+    ]:
+        assert list(packed[start:stop:step]) == lines[start:stop:step]
+    if "" in lines:
+        assert packed.index("") == lines.index("")
+        assert packed[1:].index("") == lines[1:].index("")
+    else:
+        with pytest.raises(ValueError):
+            packed.index("")
+
+
+def test_packed_lines_index_matches_whole_lines() -> None:
+    packed = PackedLines.from_bytes(b"abc\nbc\n\nc\nbc\n")
+    assert packed.index("bc") == 1
+    assert packed.index("c") == 3
+    assert packed.index("bc", 2) == 4
+    assert packed[2:].index("bc") == 2
+    with pytest.raises(ValueError):
+        packed.index("bc", 2, 4)
+
+
+def test_packed_lines_are_smaller_than_a_list() -> None:
+    lines = [str(i) for i in range(10_000)]
+    packed = PackedLines.from_bytes("\n".join(lines).encode())
+    list_bytes = sys.getsizeof(lines) + sum(map(sys.getsizeof, lines))
+    assert list(packed) == lines
+    assert packed.nbytes * 5 < list_bytes
+
+
+def test_corpus_inputs(tmp_path: str) -> None:
+    for filename in ("day05.txt", "test05-large.txt", "day12.txt", "notes.txt"):
+        open(os.path.join(tmp_path, filename), "w").close()
+    corpus = corpus_inputs(str(tmp_path))
+    assert list(corpus) == [5, 12]
+    assert [os.path.basename(path) for path in corpus[5]] == [
+        "day05.txt",
+        "test05-large.txt",
+    ]
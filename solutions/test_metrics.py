@@ -0,0 +1,81 @@
+import json
+
+from .day16.solution import parse_network, part_one_alpha, part_two_alpha
+from .day19.solution import build_initial_state, maximize_geodes
+from .metrics import SearchMetrics, collect_metrics
+
+EXAMPLE_NETWORK = [
+    "Valve AA has flow rate=0; tunnels lead to valves DD, II, BB",
+    "Valve BB has flow rate=13; tunnels lead to valves CC, AA",
+    "Valve CC has flow rate=2; tunnels lead to valves DD, BB",
+    "Valve DD has flow rate=20; tunnels lead to valves CC, AA, EE",
+    "Valve EE has flow rate=3; tunnels lead to valves FF, DD",
+    "Valve FF has flow rate=0; tunnels lead to valves EE, GG",
+    "Valve GG has flow rate=0; tunnels lead to valves FF, HH",
+    "Valve HH has flow rate=22; tunnel leads to valve GG",
+    "Valve II has flow rate=0; tunnels lead to valves AA, JJ",
+    "Valve JJ has flow rate=21; tunnel leads to valve II",
+]
+EXAMPLE_BLUEPRINT = (
+    "Blueprint 1: Each ore robot costs 4 ore. Each clay robot costs 2 ore. "
+    "Each obsidian robot costs 3 ore and 14 clay. "
+    "Each geode robot costs 2 ore and 7 obsidian."
+)
+
+
+def test_metrics_are_only_collected_when_asked_for() -> None:
+    SearchMetrics("uncollected").finish()
+    with collect_metrics(False) as collected:
+        SearchMetrics("disabled").finish()
+    assert collected == []
+    with collect_metrics() as collected:
+        SearchMetrics("collected").finish()
+    assert [metrics.search for metrics in collected] == ["collected"]
+
+
+def test_first_incumbent_is_kept() -> None:
+    metrics = SearchMetrics("search")
+    metrics.found_incumbent()
+    first = metrics.first_incumbent_ns
+    metrics.found_incumbent()
+    assert metrics.first_incumbent_ns == first is not None
+
+
+def test_to_json() -> None:
+    metrics = SearchMetrics("search", nodes_expanded=3, peak_frontier=2)
+    assert json.loads(metrics.to_json()) == {
+        "search": "search",
+        "nodes_expanded": 3,
+        "pruned_by_bound": 0,
+        "pruned_by_dominance": 0,
+        "peak_frontier": 2,
+        "first_incumbent_ns": None,
+        "elapsed_ns": 0,
+    }
+
+
+def test_day16_metrics() -> None:
+    network, starting_valve = parse_network(EXAMPLE_NETWORK)
+    with collect_metrics() as collected:
+        assert part_one_alpha(network, starting_valve) == 1651
+        assert part_two_alpha(network, starting_valve) == 1707
+    assert [metrics.search for metrics in collected] == ["day16.part1", "day16.part2"]
+    for metrics in collected:
+        assert metrics.nodes_expanded > 0
+        assert metrics.pruned_by_bound > 0
+        assert metrics.peak_frontier > 0
+        assert metrics.first_incumbent_ns is not None
+        assert 0 < metrics.first_incumbent_ns <= metrics.elapsed_ns
+    assert collected[0].pruned_by_dominance == 0
+    assert collected[1].pruned_by_dominance > 0
+
+
+def test_day19_metrics() -> None:
+    with collect_metrics() as collected:
+        assert maximize_geodes(build_initial_state(EXAMPLE_BLUEPRINT), 20) == 2
+    (metrics,) = collected
+    assert metrics.search == "day19.blueprint1.20min"
+    assert metrics.nodes_expanded > 0
+    assert metrics.pruned_by_bound > 0
+    assert metrics.peak_frontier >= metrics.pruned_by_bound
+    assert metrics.first_incumbent_ns is not None
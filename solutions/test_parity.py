@@ -0,0 +1,39 @@
+import shutil
+
+import pytest
+
+from .generators import write_input
+from .parity import ParityResult, build_go, compare, format_answer, format_table
+
+needs_go = pytest.mark.skipif(shutil.which("go") is None, reason="needs go")
+
+
+def result(python_answer: str, go_answer: str) -> ParityResult:
+    return ParityResult(1, "inputs/day01.txt", 10, python_answer, go_answer, 4000, 0)
+
+
+def test_format_answer() -> None:
+    assert format_answer((24000, 45000)) == "24000 45000"
+    assert format_answer(7) == "7"
+
+
+def test_format_table() -> None:
+    header, matching, differing = format_table(
+        [result("1 2", "1 2"), result("1 2", "1 3")]
+    )
+    assert "match" in matching and matching.endswith("day01.txt")
+    assert "python '1 2' != go '1 3'" in differing
+
+
+@pytest.fixture(scope="module")
+def go_binary(tmp_path_factory) -> str:
+    return build_go(str(tmp_path_factory.mktemp("go")))
+
+
+@needs_go
+@pytest.mark.parametrize("day_number, size", [(1, 50), (2, 100), (3, 30), (8, 20)])
+def test_ports_agree(go_binary: str, tmp_path, day_number: int, size: int) -> None:
+    input_filepath = write_input(str(tmp_path), day_number, size, 0)
+    parity = compare(go_binary, day_number, 0, input_filepath, repeats=1)
+    assert parity.matches, (parity.python_answer, parity.go_answer)
+    assert parity.python_ns > 0 and parity.go_ns > 0
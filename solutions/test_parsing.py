@@ -0,0 +1,66 @@
+import pytest
+
+from .parsing import ArgsModel, build_parser
+
+
+class ExampleArgs(ArgsModel):
+    day_number: int
+    input_filepath: str | None = None
+    version: int = 0
+    limit: int | None = None
+    glob: str = "*"
+    debug: bool
+    no_cache: bool
+
+    class Meta:
+        flags: dict[str, tuple[str, str] | tuple[str] | str] = {
+            "version": ("v", "version"),
+            "limit": ("limit",),
+            "glob": "glob",
+            "no_cache": "no-cache",
+        }
+
+
+def test_defaults() -> None:
+    args = build_parser(ExampleArgs).parse(["5"])
+    assert args.day_number == 5
+    assert args.input_filepath is None
+    assert args.version == 0
+    assert args.limit is None
+    assert args.glob == "*"
+    assert args.debug is False
+    assert args.no_cache is False
+
+
+def test_all_arguments() -> None:
+    args = build_parser(ExampleArgs).parse(
+        ["5", "in.txt", "-v", "2", "--limit", "7", "--glob", "*.txt"]
+        + ["--debug", "--no-cache"]
+    )
+    assert args.day_number == 5
+    assert args.input_filepath == "in.txt"
+    assert args.version == 2
+    assert args.limit == 7
+    assert args.glob == "*.txt"
+    assert args.debug is True
+    assert args.no_cache is True
+
+
+def test_long_version_flag() -> None:
+    assert build_parser(ExampleArgs).parse(["5", "--version", "1"]).version == 1
+
+
+def test_bad_type() -> None:
+    with pytest.raises(SystemExit):
+        build_parser(ExampleArgs).parse(["five"])
+
+
+def test_model_fields() -> None:
+    fields = ExampleArgs.__fields__
+    assert fields["day_number"].required
+    assert fields["limit"].type_ is int and fields["limit"].default is None
+    assert fields["debug"].type_ is bool and not fields["debug"].required
+    with pytest.raises(TypeError):
+        ExampleArgs()
+    with pytest.raises(TypeError):
+        ExampleArgs(day_number=1, unknown=2)
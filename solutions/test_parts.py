@@ -0,0 +1,84 @@
+import pytest
+
+from .day16 import solution as day16
+from .generators import generate
+from .parts import get_stages, parse_parts, solve_parts, staged
+from .registry import solution_functions
+
+calls: list[str] = []
+
+
+def parse(inputs: list[str]) -> list[int]:
+    calls.append("parse")
+    return list(map(int, inputs))
+
+
+def part_one(numbers: list[int]) -> int:
+    calls.append("part 1")
+    return sum(numbers)
+
+
+def part_two(numbers: list[int]) -> int:
+    calls.append("part 2")
+    return max(numbers)
+
+
+@staged(parse=parse, part1=part_one, part2=part_two)
+def alpha(inputs: list[str], debug: bool) -> tuple[int, int]:
+    numbers = parse(inputs)
+    return part_one(numbers), part_two(numbers)
+
+
+def unstaged(inputs: list[str], debug: bool) -> tuple[int, int]:
+    calls.append("solve")
+    return len(inputs), 0
+
+
+@pytest.fixture(autouse=True)
+def reset_calls() -> None:
+    calls.clear()
+
+
+def test_parse_parts() -> None:
+    assert parse_parts("1") == (1,)
+    assert parse_parts("2,1") == (1, 2)
+    with pytest.raises(ValueError):
+        parse_parts("3")
+
+
+def test_staged_solver_still_solves_both() -> None:
+    assert alpha(["3", "5"], False) == (8, 5)
+    assert get_stages(alpha) is not None
+    assert get_stages(unstaged) is None
+
+
+def test_one_part_skips_the_other() -> None:
+    answers, timings = solve_parts(alpha, ["3", "5"], (2,))
+    assert answers == {2: 5}
+    assert calls == ["parse", "part 2"]
+    assert [stage for stage, _ in timings] == ["parse", "part 2"]
+
+
+def test_both_parts_share_one_parse() -> None:
+    answers, timings = solve_parts(alpha, ["3", "5"], (1, 2))
+    assert answers == {1: 8, 2: 5}
+    assert calls == ["parse", "part 1", "part 2"]
+
+
+def test_unstaged_solver_runs_whole() -> None:
+    answers, timings = solve_parts(unstaged, ["a", "b"], (1,))
+    assert answers == {1: 2}
+    assert [stage for stage, _ in timings] == ["solve"]
+
+
+def test_day16_part_one_skips_part_two(monkeypatch) -> None:
+    inputs = generate(16, 10, 3)
+    network, starting_valve = day16.parse_network(inputs)
+    expected = day16.part_one_alpha(network, starting_valve)
+
+    def fail(*args, **kwargs) -> int:
+        raise AssertionError("part two ran")
+
+    monkeypatch.setattr(day16, "part_two_alpha", fail)
+    answers, _ = solve_parts(solution_functions[16][0], inputs, (1,))
+    assert answers == {1: expected}
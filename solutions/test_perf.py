@@ -0,0 +1,56 @@
+"""
+Time and memory budgets for each day, checked only with `pytest --benchmarks`.
+"""
+
+import json
+import os
+
+import pytest
+
+from .generators import generate
+from .inputs import read_input
+from .registry import solution_functions
+from .sweep import peak_memory
+from .timing import format_ns, measure, quiet
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), "perf_budgets.json")
+REPEATS = 3
+
+with open(BUDGETS_PATH) as f:
+    BUDGETS: dict[str, dict[str, int]] = json.load(f)
+
+pytestmark = pytest.mark.benchmark
+
+
+def check_budget(day_number: int, inputs: list[str], budget: dict[str, int]) -> None:
+    """Median time over the repeats, and peak memory from a separate run."""
+    solver = solution_functions[day_number][0]
+    with quiet():
+        _, stats = measure(
+            lambda: solver(list(inputs), False), warmups=1, repeats=REPEATS
+        )
+        peak_bytes = peak_memory(lambda: solver(list(inputs), False))
+    assert stats.median_ns <= budget["time_ms"] * 1_000_000, (
+        f"day {day_number} median {format_ns(stats.median_ns)} "
+        f"over its {budget['time_ms']} ms budget"
+    )
+    assert peak_bytes <= budget["memory_kb"] * 1024, (
+        f"day {day_number} peak {peak_bytes // 1024} KiB "
+        f"over its {budget['memory_kb']} KiB budget"
+    )
+
+
+@pytest.mark.parametrize("day", sorted(BUDGETS, key=int))
+def test_generated_input(day: str) -> None:
+    budget = BUDGETS[day]
+    inputs = generate(int(day), budget["size"], budget["seed"])
+    check_budget(int(day), inputs, budget)
+
+
+@pytest.mark.parametrize("day", sorted(BUDGETS, key=int))
+def test_example(day: str) -> None:
+    """Examples are never bigger than the generated inputs, so share budgets."""
+    example_path = f"inputs/test{int(day):02}.txt"
+    if not os.path.exists(example_path):
+        pytest.skip(f"no example at {example_path}")
+    check_budget(int(day), read_input(example_path), BUDGETS[day])
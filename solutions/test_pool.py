@@ -0,0 +1,37 @@
+import os
+
+from .pool import Job, JobResult, run_jobs, solve_job
+
+JOBS = [Job(1, 0, f"input{n}.txt") for n in range(6)]
+
+
+def solve_or_die(job: Job) -> JobResult:
+    if job.input_filepath == "input3.txt":
+        os._exit(1)
+    if job.input_filepath == "input4.txt":
+        raise ValueError(job.input_filepath)
+    return JobResult(job, job.input_filepath, "", None, 1)
+
+
+def test_dead_worker_fails_only_its_job() -> None:
+    results = {result.job: result for result in run_jobs(JOBS, 2, solve_or_die)}
+    assert set(results) == set(JOBS)
+    failed = {result.job.input_filepath for result in results.values() if result.error}
+    assert failed == {"input3.txt", "input4.txt"}
+    assert "BrokenProcessPool" in results[JOBS[3]].error
+    assert results[JOBS[0]].answer == "input0.txt"
+
+
+def test_solve_job_keeps_output(tmp_path: str) -> None:
+    input_filepath = os.path.join(tmp_path, "day10.txt")
+    with open(input_filepath, "w") as f:
+        f.write("noop\n" * 240)
+    result = solve_job(Job(10, 0, input_filepath))
+    assert result.error is None
+    assert result.output.count("\n") >= 6
+
+
+def test_solve_job_error(tmp_path: str) -> None:
+    result = solve_job(Job(1, 0, os.path.join(tmp_path, "missing.txt")))
+    assert result.answer is None
+    assert "FileNotFoundError" in result.error
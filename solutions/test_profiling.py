@@ -0,0 +1,118 @@
+import time
+import tracemalloc
+
+import pytest
+
+from . import profiling
+from .profiling import hot_path, hot_path_timers
+
+
+@pytest.fixture
+def hot_paths(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(profiling, "HOT_PATHS_ENABLED", True)
+    hot_path_timers.reset()
+    yield hot_path_timers
+    hot_path_timers.reset()
+
+
+def countdown(n: int) -> int:
+    """Counts down recursively."""
+    return n if n == 0 else countdown(n - 1)
+
+
+def test_disabled_returns_function(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(profiling, "HOT_PATHS_ENABLED", False)
+    assert hot_path(countdown) is countdown
+
+
+def test_wrapper_keeps_metadata(hot_paths: profiling.HotPathTimers) -> None:
+    timed = hot_path(countdown)
+    assert timed is not countdown
+    assert timed.__name__ == "countdown"
+    assert timed.__doc__ == "Counts down recursively."
+    assert timed.__wrapped__ is countdown
+
+
+def test_recursion_timed_once(hot_paths: profiling.HotPathTimers) -> None:
+    global countdown
+    original = countdown
+    countdown = hot_path(original)
+    try:
+        countdown(5)
+        countdown(3)
+    finally:
+        countdown = original
+    key = original.__qualname__
+    assert hot_paths.calls == {key: 2}
+    assert hot_paths.totals[key] > 0
+    assert hot_paths.report()[0].startswith(f"{key}: ")
+
+
+def test_trace_memory() -> None:
+    with profiling.trace_memory(top_n=5) as report:
+        held = [bytes(1000) for _ in range(10_000)]
+    assert report.peak_bytes >= 10_000_000
+    assert report.top_sites[0].filename == __file__
+    assert report.top_sites[0].size_bytes >= 10_000_000
+    for site in report.top_sites:
+        assert "threading" not in site.filename
+        assert "_weakrefset" not in site.filename
+    del held
+
+
+def test_trace_memory_freed() -> None:
+    """Memory freed before the block ends still shows at its peak."""
+    with profiling.trace_memory(interval=0.001) as report:
+        for _ in range(3):
+            held = [bytes(1000) for _ in range(10_000)]
+            time.sleep(0.01)
+            del held
+    assert report.peak_bytes >= 10_000_000
+    assert report.top_sites[0].filename == __file__
+
+
+def test_trace_memory_snapshots_are_few(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Snapshots copy every live trace, so growing to 64 MiB in small steps
+    must take a few of them, one per doubling, rather than one per step.
+    """
+    snapshots: list[int] = []
+    take_snapshot = tracemalloc.take_snapshot
+
+    def counted_take_snapshot() -> tracemalloc.Snapshot:
+        snapshots.append(tracemalloc.get_traced_memory()[0])
+        return take_snapshot()
+
+    monkeypatch.setattr(tracemalloc, "take_snapshot", counted_take_snapshot)
+    with profiling.trace_memory(interval=0.001) as report:
+        held = []
+        for _ in range(64):
+            held.append(bytes(1024 * 1024))
+            time.sleep(0.002)
+    assert report.peak_bytes >= 64 * 1024 * 1024
+    assert report.top_sites[0].filename == __file__
+    assert 1 <= len(snapshots) <= 8
+    del held
+
+
+def spin(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    spins = 0
+    while time.perf_counter() < deadline:
+        spins += 1
+    return spins
+
+
+def test_sample_stacks(tmp_path, capsys) -> None:
+    output_filepath = tmp_path / "stacks.collapsed"
+    with profiling.sample_stacks(str(output_filepath), interval=0.001) as samples:
+        spin(0.1)
+    assert f"written to {output_filepath}" in capsys.readouterr().out
+    assert samples.total > 10
+    lines = output_filepath.read_text().splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == samples.total
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.split(";")[-2].startswith("test_sample_stacks (")
+    assert stack.split(";")[-1].startswith("spin (")
+    header, top = samples.report(top_n=1)
+    assert top.startswith("spin (")
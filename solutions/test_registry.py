@@ -0,0 +1,48 @@
+import sys
+
+import pytest
+
+from .registry import SolutionRegistry, day_module_name
+
+# The mapping `__main__` hard-coded before days were looked up lazily, plus
+# the versions added since.
+HARD_CODED_VERSIONS: dict[int, tuple[str, ...]] = {
+    **{day: ("alpha",) for day in range(1, 23)},
+    1: ("alpha", "beta", "gamma"),
+    6: ("alpha", "beta"),
+    8: ("alpha", "beta"),
+    9: ("alpha", "beta"),
+}
+
+
+@pytest.fixture
+def registry() -> SolutionRegistry:
+    return SolutionRegistry()
+
+
+def test_day_numbers(registry: SolutionRegistry) -> None:
+    assert registry.day_numbers == tuple(sorted(HARD_CODED_VERSIONS))
+    assert list(registry) == sorted(HARD_CODED_VERSIONS)
+
+
+@pytest.mark.parametrize("day_number", sorted(HARD_CODED_VERSIONS))
+def test_versions(registry: SolutionRegistry, day_number: int) -> None:
+    solvers = registry[day_number]
+    module = sys.modules[f"solutions.{day_module_name(day_number)}"]
+    assert solvers == [
+        getattr(module, name) for name in HARD_CODED_VERSIONS[day_number]
+    ]
+
+
+def test_lazy_import(registry: SolutionRegistry) -> None:
+    sys.modules.pop("solutions.day13", None)
+    assert registry.day_numbers
+    assert "solutions.day13" not in sys.modules
+    registry[13]
+    assert "solutions.day13" in sys.modules
+
+
+def test_missing_day(registry: SolutionRegistry) -> None:
+    with pytest.raises(KeyError):
+        registry[25]
+    assert registry.get(25, []) == []
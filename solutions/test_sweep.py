@@ -0,0 +1,91 @@
+import json
+import math
+
+import pytest
+
+from .sweep import (
+    SweepPoint,
+    SweepResult,
+    find_exponent_jumps,
+    fit_exponent,
+    halvings,
+    main,
+    prefixes,
+    read_baseline,
+    replications,
+    sweep,
+    write_baseline,
+)
+
+
+def result(key: str, time_exponent: float, memory_exponent: float) -> SweepResult:
+    return SweepResult(key, [SweepPoint(1, 1, 1)], time_exponent, memory_exponent)
+
+
+@pytest.mark.parametrize("exponent", [0.5, 1, 2, 3])
+def test_fit_exponent(exponent: float) -> None:
+    samples = [(size, round(7 * size**exponent)) for size in (10, 100, 1000)]
+    assert fit_exponent(samples) == pytest.approx(exponent, abs=0.01)
+
+
+def test_fit_exponent_needs_two_sizes() -> None:
+    assert math.isnan(fit_exponent([(10, 5), (10, 6)]))
+    assert math.isnan(fit_exponent([(10, 5), (20, 0)]))
+
+
+def test_halvings() -> None:
+    assert halvings(1000, 4) == [125, 250, 500, 1000]
+    assert halvings(3, 4) == [1, 3]
+
+
+def test_prefixes_and_replications() -> None:
+    lines = ["a", "b", "c", "d"]
+    assert prefixes(lines, 3) == [(1, ["a"]), (2, ["a", "b"]), (4, lines)]
+    assert replications(lines[:2], 3) == [
+        (2, ["a", "b"]),
+        (4, ["a", "b"] * 2),
+        (8, ["a", "b"] * 4),
+    ]
+
+
+def test_sweep_records_each_size() -> None:
+    def solver(inputs: list[str], debug: bool) -> tuple[int, int]:
+        print("not in the sweep's output")
+        return len(inputs), len([line * len(inputs) for line in inputs])
+
+    sized_inputs = replications(["x" * 100], 4)
+    swept = sweep(solver, "key", sized_inputs, repeats=1)
+    assert [point.size for point in swept.points] == [1, 2, 4, 8]
+    assert all(point.peak_bytes > 0 for point in swept.points)
+    assert swept.memory_exponent > 1
+
+
+def test_find_exponent_jumps() -> None:
+    baseline = {"a": result("a", 1, 1), "b": result("b", 1, 1)}
+    results = [result("a", 1.2, 0.9), result("b", 2, 1), result("c", 3, 3)]
+    (jump,) = find_exponent_jumps(baseline, results, 0.3)
+    assert jump.startswith("b: time exponent 2.00 vs baseline 1.00")
+
+
+def test_baseline_round_trip(tmp_path) -> None:
+    baseline_filepath = str(tmp_path / "sweep.json")
+    assert read_baseline(baseline_filepath) == {}
+    results = {"a": result("a", 1.5, 1)}
+    write_baseline(baseline_filepath, results)
+    assert read_baseline(baseline_filepath) == results
+
+
+def test_main_flags_a_jump(tmp_path, capsys) -> None:
+    baseline_filepath = str(tmp_path / "sweep.json")
+    argv = ["1", "--mode", "generate", "-n", "400", "--steps", "3", "-r", "1"]
+    main(argv + ["--baseline", baseline_filepath])
+    key = "day01:v0:generate"
+    assert f"Wrote {key}" in capsys.readouterr().out
+
+    written = read_baseline(baseline_filepath)[key]
+    write_baseline(baseline_filepath, {key: SweepResult(key, written.points, -5, -5)})
+    with pytest.raises(SystemExit):
+        main(argv + ["--baseline", baseline_filepath, "--json"])
+    first, *jumps = capsys.readouterr().out.splitlines()
+    assert json.loads(first)["key"] == key
+    assert jumps[0].startswith(f"EXPONENT JUMP {key}: time exponent")
@@ -0,0 +1,21 @@
+from .timing import solve_captured
+
+
+def test_solve_captured() -> None:
+    with solve_captured() as solved:
+        print("setup")
+        solved.time(lambda: print("solving") or (1, 2))
+    assert solved.answer == "(1, 2)"
+    assert solved.output == "setup\nsolving\n"
+    assert solved.error is None
+    assert solved.elapsed_ns > 0
+
+
+def test_solve_captured_error() -> None:
+    with solve_captured() as solved:
+        print("partial")
+        solved.time(lambda: {}["missing"])
+    assert solved.answer is None
+    assert solved.output == "partial\n"
+    assert solved.error == "KeyError('missing')"
+    assert solved.elapsed_ns == 0
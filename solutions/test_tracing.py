@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from . import day05
+from .day09 import beta
+from .generators import write_input
+from .inputs import read_input
+from .tracing import channel, parse_spec, trace_to
+
+MOVES = ["R 4", "U 4", "L 3", "D 1", "R 4", "D 1", "L 5", "R 2"]
+
+
+def read_events(trace_filepath) -> list[dict]:
+    with open(trace_filepath) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_parse_spec() -> None:
+    assert parse_spec("day16.*=1000,day05.stacks") == {
+        "day16.*": 1000,
+        "day05.stacks": 1,
+    }
+    assert parse_spec("") == {}
+    with pytest.raises(ValueError):
+        parse_spec("day05.stacks=0")
+
+
+def test_disabled_channels_are_none(tmp_path) -> None:
+    assert channel("day05.stacks") is None
+    with trace_to("day16.*", str(tmp_path / "trace.jsonl")):
+        assert channel("day05.stacks") is None
+        assert channel("day16.search") is not None
+    assert channel("day16.search") is None
+
+
+def test_sampling(tmp_path) -> None:
+    trace_filepath = tmp_path / "trace.jsonl"
+    with trace_to("test.*=3", str(trace_filepath)):
+        trace = channel("test.loop")
+        assert trace is not None
+        for step in range(10):
+            trace(step=step)
+    events = read_events(trace_filepath)
+    assert [event["event"] for event in events] == [3, 6, 9]
+    assert events[0] == {"channel": "test.loop", "event": 3, "step": 2}
+
+
+def test_traced_solver_writes_to_file(tmp_path, capsys) -> None:
+    trace_filepath = tmp_path / "trace.jsonl"
+    untraced = beta(MOVES, False)
+    with trace_to("day09.tail", str(trace_filepath)):
+        assert beta(MOVES, False) == untraced
+    assert capsys.readouterr().out == ""
+    events = read_events(trace_filepath)
+    assert len(events) == untraced[1] - 1
+    assert all(event["channel"] == "day09.tail" for event in events)
+
+
+def test_pool_workers_trace_whole_lines(tmp_path) -> None:
+    """Pool workers exit without closing the trace file they share."""
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    expected_filepath = tmp_path / "expected.jsonl"
+    with trace_to("day05.stacks", str(expected_filepath)):
+        for seed in range(3):
+            day05.alpha(read_input(write_input(str(corpus_dir), 5, 40, seed)))
+    trace_filepath = tmp_path / "trace.jsonl"
+    subprocess.run(
+        [sys.executable, "-m", "solutions", "pool", "--corpus", str(corpus_dir)]
+        + ["-j", "2", "--no-cache"],
+        env={
+            **os.environ,
+            "AOC_TRACE": "day05.stacks",
+            "AOC_TRACE_FILE": str(trace_filepath),
+        },
+        cwd=os.path.dirname(os.path.dirname(__file__)),
+        capture_output=True,
+        check=True,
+    )
+    events = read_events(trace_filepath)
+    assert len(events) == len(read_events(expected_filepath))
+    assert {event["channel"] for event in events} == {"day05.stacks"}
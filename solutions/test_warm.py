@@ -0,0 +1,30 @@
+import pytest
+
+from . import warm
+from .warm import warm_cache
+
+
+@pytest.fixture
+def parse_calls() -> list[list[str]]:
+    return []
+
+
+def test_disabled(parse_calls: list[list[str]]) -> None:
+    parse = warm_cache(lambda inputs: parse_calls.append(inputs) or len(inputs))
+    assert parse(iter(["a", "b"])) == 2
+    assert parse(["a", "b"]) == 2
+    assert parse_calls == [["a", "b"], ["a", "b"]]
+
+
+def test_enabled(parse_calls: list[list[str]], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(warm, "WARM_CACHE_ENABLED", True)
+    monkeypatch.setattr(warm, "WARM_CACHE_SIZE", 2)
+    parse = warm_cache(lambda inputs: parse_calls.append(inputs) or object())
+    first = parse(["a"])
+    assert parse(iter(["a"])) is first
+    parse(["b"])
+    parse(["a"])
+    parse(["c"])
+    assert parse(["a"]) is first
+    parse(["b"])
+    assert parse_calls == [["a"], ["b"], ["c"], ["b"]]
@@ -0,0 +1,91 @@
+import io
+import math
+import os
+import statistics
+import time
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    min_ns: int
+    median_ns: int
+    p95_ns: int
+    repeats: int
+
+    @classmethod
+    def from_samples(cls, samples: list[int]) -> "TimingStats":
+        ordered = sorted(samples)
+        p95_rank = math.ceil(0.95 * len(ordered)) - 1
+        return cls(
+            min_ns=ordered[0],
+            median_ns=int(statistics.median(ordered)),
+            p95_ns=ordered[p95_rank],
+            repeats=len(ordered),
+        )
+
+
+def time_call(func: Callable[[], Any]) -> tuple[Any, int]:
+    start = time.perf_counter_ns()
+    value = func()
+    return value, time.perf_counter_ns() - start
+
+
+@dataclass
+class CapturedSolve:
+    answer: str | None = None
+    output: str = ""
+    error: str | None = None
+    elapsed_ns: int = 0
+
+    def time(self, solve: Callable[[], Any]) -> None:
+        answer, self.elapsed_ns = time_call(solve)
+        self.answer = repr(answer)
+
+
+@contextmanager
+def solve_captured() -> Iterator[CapturedSolve]:
+    """
+    What's printed in the block is kept with the answer, since some answers
+    (e.g. day 10 part 2) are only printed. The block times just the solve
+    with `time`, leaving out any setup. An exception raised anywhere in it
+    becomes the error instead of propagating.
+    """
+    solved = CapturedSolve()
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output):
+            yield solved
+    except Exception as e:
+        solved.answer = None
+        solved.error = repr(e)
+        solved.elapsed_ns = 0
+    finally:
+        solved.output = output.getvalue()
+
+
+def measure(
+    func: Callable[[], Any], warmups: int = 1, repeats: int = 5
+) -> tuple[Any, TimingStats]:
+    """Returns the value of the last call along with timings of the repeats."""
+    for _ in range(warmups):
+        func()
+    samples: list[int] = []
+    value = None
+    for _ in range(repeats):
+        value, elapsed_ns = time_call(func)
+        samples.append(elapsed_ns)
+    return value, TimingStats.from_samples(samples)
+
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    """Solvers print as they go; keep that out of timed runs' output."""
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        yield
+
+
+def format_ns(ns: int) -> str:
+    return f"{ns / 1_000_000:.3f} ms"
@@ -0,0 +1,103 @@
+import json
+import os
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from typing import Any, Iterator, TextIO
+
+TRACE_SPEC = os.environ.get("AOC_TRACE")
+TRACE_FILE = os.environ.get("AOC_TRACE_FILE", "trace.jsonl")
+
+
+class Channel:
+    """
+    A named stream of trace events, of which one in every `every` is written
+    as a JSON line. Only enabled channels exist: solvers ask for theirs once,
+    before their loops, and get None if it's off. A disabled channel then
+    costs a loop one test of a local, and builds no arguments.
+    """
+
+    name: str
+    every: int
+    events: int
+    _file: TextIO
+
+    def __init__(self, name: str, every: int, file: TextIO) -> None:
+        self.name = name
+        self.every = every
+        self.events = 0
+        self._file = file
+
+    def __call__(self, **fields: Any) -> None:
+        self.events += 1
+        if self.events % self.every == 0:
+            event = {"channel": self.name, "event": self.events, **fields}
+            self._file.write(json.dumps(event, default=repr) + "\n")
+
+
+class Tracer:
+    rates: dict[str, int]
+    file: TextIO
+
+    def __init__(self, rates: dict[str, int], file: TextIO) -> None:
+        self.rates = rates
+        self.file = file
+
+    def channel(self, name: str) -> Channel | None:
+        for pattern, every in self.rates.items():
+            if fnmatchcase(name, pattern):
+                return Channel(name, every, self.file)
+        return None
+
+
+_tracer: Tracer | None = None
+
+
+def parse_spec(spec: str) -> dict[str, int]:
+    """
+    `day16.*=1000,day05.stacks` traces one in 1000 events of every day 16
+    channel and all of day 5's stacks events.
+    """
+    rates: dict[str, int] = {}
+    for part in filter(None, spec.split(",")):
+        pattern, _, every_str = part.partition("=")
+        every = int(every_str) if every_str else 1
+        if every < 1:
+            raise ValueError(f"Sampling must keep one in N events, N >= 1: {part}")
+        rates[pattern.strip()] = every
+    return rates
+
+
+def channel(name: str) -> Channel | None:
+    if _tracer is None and TRACE_SPEC:
+        start_tracing(TRACE_SPEC, TRACE_FILE)
+    return _tracer.channel(name) if _tracer is not None else None
+
+
+def start_tracing(spec: str, trace_filepath: str) -> None:
+    """
+    The file is line buffered, so each event is one append. Events aren't
+    lost when a process ends without closing the file, as pool workers do,
+    and processes tracing to the same file don't split each other's lines.
+    """
+    global _tracer
+    _tracer = Tracer(parse_spec(spec), open(trace_filepath, "a", buffering=1))
+
+
+def stop_tracing() -> None:
+    global _tracer
+    if _tracer is not None:
+        _tracer.file.close()
+        _tracer = None
+
+
+@contextmanager
+def trace_to(spec: str | None, trace_filepath: str = TRACE_FILE) -> Iterator[None]:
+    """Traces are appended to a file, never stdout, so timings aren't skewed."""
+    if not spec:
+        yield
+        return
+    start_tracing(spec, trace_filepath)
+    try:
+        yield
+    finally:
+        stop_tracing()
@@ -0,0 +1,41 @@
+import hashlib
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+WARM_CACHE_ENABLED = False
+WARM_CACHE_SIZE = 32
+
+
+def enable() -> None:
+    """Only long-lived processes, i.e. the daemon, should keep parsed inputs."""
+    global WARM_CACHE_ENABLED
+    WARM_CACHE_ENABLED = True
+
+
+def warm_cache(parse: Callable[[list[str]], T]) -> Callable[[Iterable[str]], T]:
+    """
+    Memoizes a day's parse step by a hash of its input lines, so that a
+    structure that fills in as it's used (e.g. day 16's distance table) stays
+    filled in across requests for the same input. Parsed values are shared
+    between calls, so solvers must only add to them, never undo them.
+    """
+    cache: OrderedDict[str, T] = OrderedDict()
+
+    @wraps(parse)
+    def wrapper(inputs: Iterable[str]) -> T:
+        input_list = list(inputs)
+        if not WARM_CACHE_ENABLED:
+            return parse(input_list)
+        key = hashlib.sha256("\n".join(input_list).encode()).hexdigest()
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = parse(input_list)
+            if len(cache) > WARM_CACHE_SIZE:
+                cache.popitem(last=False)
+        return cache[key]
+
+    return wrapper